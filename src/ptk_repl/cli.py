@@ -283,11 +283,16 @@ class PromptToolkitCLI:
 
     def _print_welcome(self) -> None:
         """打印欢迎信息。"""
-        from colorama import Fore, Style, init
         from pyfiglet import Figlet
 
-        # 初始化 colorama（Windows 需要）
-        init(autoreset=True)
+        from ptk_repl.core.configuration.themes.ansi import (
+            Fore,
+            Style,
+            enable_vt_on_windows,
+        )
+
+        # 开启 VT 转义处理（仅 Windows 需要，幂等）
+        enable_vt_on_windows()
 
         # 创建 Figlet 对象
         f = Figlet(font="block")  # 其他流行字体: 'banner', 'block', 'bubble', 'digital'
@@ -25,10 +25,10 @@ class CommandModule(ABC):
         """模块描述。"""
         return ""
 
-    @property
-    def aliases(self) -> str | None:
-        """模块短别名（如 'db' 代表 'database'）。"""
-        return None
+    # 模块短别名（如 'db' 代表 'database'）。
+    # 声明为类属性，懒加载追踪器可直接从类上读取而无需实例化；
+    # 子类也可以用 property 覆盖（将退化为一次临时实例读取）
+    aliases: str | None = None
 
     @property
     def version(self) -> str:
@@ -1,6 +1,8 @@
 """自动命令补全系统 - 从 CommandRegistry 自动发现命令。"""
 
-from collections.abc import Generator
+from bisect import bisect_left
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
 from ptk_repl.core.interfaces.registry import IRegistry
@@ -39,8 +41,11 @@ class AutoCompleter:
             registry: 命令注册表实例
         """
         self._registry = registry
-        self._completion_dict: dict[str, list[str]] | None = None
+        self._completion_dict: dict[str, tuple[str, ...]] | None = None
         self._lazy_module_commands: dict[str, list[str]] = {}
+        # 批量失效模式：批量注册期间只记脏标记，退出时统一失效一次
+        self._batched = False
+        self._batch_dirty = False
 
     def register_lazy_commands(self, module_name: str, commands: list[str]) -> None:
         """注册懒加载模块的命令列表（用于补全）。
@@ -84,51 +89,78 @@ class AutoCompleter:
         self._invalidate_cache()
 
     def _invalidate_cache(self) -> None:
-        """使缓存失效，强制下次访问时重新生成。"""
+        """使缓存失效，强制下次访问时重新生成。
+
+        批量模式下只记脏标记，真正的失效推迟到批量结束。
+        """
+        if self._batched:
+            self._batch_dirty = True
+            return
         self._completion_dict = None
 
-    def build_completion_dict(self) -> dict[str, list[str]]:
+    @contextmanager
+    def batch_invalidate(self) -> Iterator[None]:
+        """批量失效上下文：批量加载模块时将 N 次失效合并为一次。
+
+        Example:
+            >>> with completer.batch_invalidate():
+            ...     for name in module_names:
+            ...         loader.load(name)  # 期间的 refresh() 只记脏标记
+        """
+        self._batched = True
+        try:
+            yield
+        finally:
+            self._batched = False
+            if self._batch_dirty:
+                self._batch_dirty = False
+                self._completion_dict = None
+
+    def build_completion_dict(self) -> dict[str, tuple[str, ...]]:
         """从注册表构建补全字典。
 
+        候选值存储为不可变元组，补全热路径可以直接复用，
+        无需每次按键重新拷贝列表。
+
         Returns:
-            补全字典 {command_prefix: [completions]}
+            补全字典 {command_prefix: (completions, ...)}
 
         Example:
             {
-                '': ['status', 'exit', 'modules', 'database', 'db', ...],
-                'database': ['connect', 'query', 'disconnect'],
-                'db': ['connect', 'query', 'disconnect'],
-                'database connect': ['localhost', '192.168.1.1'],
+                '': ('database', 'db', 'exit', 'modules', 'status', ...),
+                'database': ('connect', 'disconnect', 'query'),
+                'db': ('connect', 'disconnect', 'query'),
+                'database connect': ('localhost', '192.168.1.1'),
             }
         """
         if self._completion_dict is not None:
             return self._completion_dict
 
-        completion_dict: dict[str, list[str]] = {}
+        completion_dict: dict[str, tuple[str, ...]] = {}
 
         # 1. 核心命令补全
         core_commands = self._registry.list_module_commands("core")
-        completion_dict[""] = sorted(core_commands)
+        top_level: list[str] = sorted(core_commands)
 
         # 2. 添加所有模块名到顶层补全
         for module in self._registry.list_modules():
             if module.name != "core":
-                completion_dict[""].append(module.name)
+                top_level.append(module.name)
                 # 短别名
                 short_name = self._get_short_alias(module.name)
                 if short_name:
-                    completion_dict[""].append(short_name)
+                    top_level.append(short_name)
 
         # 3. 懒加载模块名到顶层补全
         for module_name in self._lazy_module_commands.keys():
-            if module_name not in completion_dict[""]:
-                completion_dict[""].append(module_name)
+            if module_name not in top_level:
+                top_level.append(module_name)
                 short_name = self._get_short_alias(module_name)
-                if short_name and short_name not in completion_dict[""]:
-                    completion_dict[""].append(short_name)
+                if short_name and short_name not in top_level:
+                    top_level.append(short_name)
 
         # 4. 排序顶层补全
-        completion_dict[""] = sorted(completion_dict[""])
+        completion_dict[""] = tuple(sorted(top_level))
 
         # 5. 模块命令补全
         for module in self._registry.list_modules():
@@ -138,20 +170,20 @@ class AutoCompleter:
             commands = self._registry.list_module_commands(module.name)
 
             # 完整模块名补全（如 "database"）
-            completion_dict[module.name] = sorted(commands)
+            completion_dict[module.name] = tuple(sorted(commands))
 
             # 短别名补全（如 "db"）
             short_name = self._get_short_alias(module.name)
             if short_name:
-                completion_dict[short_name] = sorted(commands)
+                completion_dict[short_name] = tuple(sorted(commands))
 
         # 6. 懒加载模块补全（未加载的模块的子命令）
         for module_name, commands in self._lazy_module_commands.items():
             if module_name not in completion_dict:
-                completion_dict[module_name] = sorted(commands)
+                completion_dict[module_name] = tuple(sorted(commands))
                 short_name = self._get_short_alias(module_name)
                 if short_name:
-                    completion_dict[short_name] = sorted(commands)
+                    completion_dict[short_name] = tuple(sorted(commands))
 
         # 7. 命令别名补全（使用公共接口）
         aliases = self._registry.get_all_aliases()
@@ -161,11 +193,12 @@ class AutoCompleter:
                 if len(parts) == 2:
                     alias_module: str = parts[0]
                     alias_cmd: str = parts[1]
-                    if alias_module not in completion_dict:
-                        completion_dict[alias_module] = []
-                    # 确保模块补全包含别名
-                    if alias_cmd not in completion_dict[alias_module]:
-                        completion_dict[alias_module].append(alias_cmd)
+                    existing_cmds = completion_dict.get(alias_module, ())
+                    # 确保模块补全包含别名（保持有序以支持二分查找）
+                    if alias_cmd not in existing_cmds:
+                        completion_dict[alias_module] = tuple(
+                            sorted((*existing_cmds, alias_cmd))
+                        )
 
         # 8. 参数补全（基于 Pydantic）
         param_completions = self._build_parameter_completions()
@@ -190,13 +223,13 @@ class AutoCompleter:
 
         return None
 
-    def _build_parameter_completions(self) -> dict[str, list[str]]:
+    def _build_parameter_completions(self) -> dict[str, tuple[str, ...]]:
         """构建基于 Pydantic 的参数补全。
 
         Returns:
             参数补全字典
         """
-        param_dict: dict[str, list[str]] = {}
+        param_dict: dict[str, tuple[str, ...]] = {}
 
         # 遍历所有命令，检查是否使用 typed_command（使用公共接口）
         commands = self._registry.get_all_commands()
@@ -221,13 +254,14 @@ class AutoCompleter:
                             params.append(short_opt)
 
                     if params:
-                        param_dict[full_cmd] = params
+                        frozen_params = tuple(sorted(params))
+                        param_dict[full_cmd] = frozen_params
 
                         # 为别名也生成参数补全（使用公共接口）
                         aliases = self._registry.get_all_aliases()
                         for alias, full in aliases.items():
                             if full == full_cmd:
-                                param_dict[alias] = params
+                                param_dict[alias] = frozen_params
 
         return param_dict
 
@@ -277,14 +311,20 @@ class AutoCompleter:
             prefix = " ".join(words[:-1])
             word = words[-1]
 
-        # 获取候选项
-        candidates = completion_dict.get(prefix, [])
+        # 获取候选项（不可变元组，直接复用缓存）
+        candidates = completion_dict.get(prefix, ())
 
-        # 过滤匹配的候选项
-        matches = [c for c in candidates if c.startswith(word)]
+        # 候选项已排序，用二分查找定位前缀命中范围 [lo, hi)，
+        # 避免对全部候选做 O(N) 的 startswith 扫描
+        if word:
+            lo = bisect_left(candidates, word)
+            hi = bisect_left(candidates, word + "\U0010ffff", lo)
+            matches = candidates[lo:hi]
+        else:
+            matches = candidates
 
         # 生成 Completion 对象（使用 yield）
-        for match in sorted(matches):
+        for match in matches:
             yield Completion(
                 text=match,
                 start_position=-len(word),
@@ -1,5 +1,7 @@
 """配置管理器。"""
 
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -8,8 +10,57 @@ from ptk_repl.core.configuration.providers import (
     EnvConfigProvider,
     IConfigProvider,
     YamlConfigProvider,
+    flatten_config,
 )
 
+# YAML 提供者实例缓存：{(绝对路径, st_mtime_ns): 提供者}
+# 重复构建 ConfigManager（测试、子 REPL）时复用同一提供者
+_YAML_PROVIDER_CACHE: dict[tuple[str, int], YamlConfigProvider] = {}
+
+
+def _yaml_provider(config_file: str) -> YamlConfigProvider:
+    """获取（可能缓存的）YAML 配置提供者。
+
+    Args:
+        config_file: 配置文件路径
+
+    Returns:
+        提供者实例，文件被修改后会重新创建
+    """
+    try:
+        stat = os.stat(config_file)
+    except OSError:
+        return YamlConfigProvider(config_file)
+
+    key = (os.path.abspath(config_file), stat.st_mtime_ns)
+    provider = _YAML_PROVIDER_CACHE.get(key)
+    if provider is None:
+        provider = YamlConfigProvider(config_file)
+        _YAML_PROVIDER_CACHE[key] = provider
+    return provider
+
+
+@lru_cache(maxsize=4)
+def _find_config(cwd: str, home: str) -> str | None:
+    """查找配置文件（按 (cwd, home) 缓存，避免重复 stat 系统调用）。
+
+    Args:
+        cwd: 当前工作目录
+        home: 用户主目录
+
+    Returns:
+        配置文件路径，如果未找到则返回 None
+    """
+    paths = (
+        os.path.join(cwd, "ptk_repl_config.yaml"),
+        os.path.join(cwd, "config", "ptk_repl.yaml"),
+        os.path.join(home, ".ptk_repl", "config.yaml"),
+    )
+    for path in paths:
+        if os.path.isfile(path):
+            return path
+    return None
+
 
 class ConfigManager:
     """配置管理器。
@@ -38,6 +89,10 @@ class ConfigManager:
         },
     }
 
+    # 摊平的默认配置（类定义时计算一次），
+    # 提供者未命中时回退为一次字典查找而非逐层遍历
+    _FLAT_DEFAULTS = flatten_config(DEFAULT_CONFIG)
+
     def __init__(
         self, config_path: str | None = None, provider: IConfigProvider | None = None
     ) -> None:
@@ -54,8 +109,8 @@ class ConfigManager:
             providers: list[IConfigProvider] = []
             config_file = config_path or self._find_config()
             if config_file:
-                # YAML 配置提供者（优先级低于环境变量）
-                providers.append(YamlConfigProvider(config_file))
+                # YAML 配置提供者（优先级低于环境变量，实例按文件缓存）
+                providers.append(_yaml_provider(config_file))
 
             # 环境变量配置提供者（优先级最高）
             providers.append(EnvConfigProvider(prefix="PTK_"))
@@ -78,15 +133,7 @@ class ConfigManager:
         Returns:
             配置文件路径，如果未找到则返回 None
         """
-        paths = [
-            Path.cwd() / "ptk_repl_config.yaml",
-            Path.cwd() / "config" / "ptk_repl.yaml",
-            Path.home() / ".ptk_repl" / "config.yaml",
-        ]
-        for path in paths:
-            if path.exists():
-                return str(path)
-        return None
+        return _find_config(os.getcwd(), str(Path.home()))
 
     def get(self, key: str, default: Any = None) -> Any:
         """获取配置值。
@@ -103,15 +150,9 @@ class ConfigManager:
         # 先从提供者获取
         value = self._provider.get(key)
 
-        # 如果提供者没有值，使用默认配置
+        # 如果提供者没有值，使用摊平的默认配置（单次查找）
         if value is None:
-            keys = key.split(".")
-            default_value: Any = self.DEFAULT_CONFIG
-            for k in keys:
-                if isinstance(default_value, dict) and k in default_value:
-                    default_value = default_value[k]
-                else:
-                    return default
+            default_value = self._FLAT_DEFAULTS.get(key)
             return default_value if default_value is not None else default
 
         return value
@@ -5,6 +5,7 @@ from ptk_repl.core.configuration.providers.config_provider import (
     EnvConfigProvider,
     IConfigProvider,
     YamlConfigProvider,
+    flatten_config,
 )
 
 __all__ = [
@@ -12,4 +13,5 @@ __all__ = [
     "IConfigProvider",
     "EnvConfigProvider",
     "YamlConfigProvider",
+    "flatten_config",
 ]
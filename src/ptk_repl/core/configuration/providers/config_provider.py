@@ -3,11 +3,51 @@
 遵循单一职责原则（SRP）和依赖倒置原则（DIP）。
 """
 
+import mmap
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Protocol, runtime_checkable
 
-from yaml import safe_load
+from yaml import load as _yaml_load
+
+try:
+    # LibYAML C 解析器（比纯 Python 解析快约一个数量级）
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+
+# 缺失哨兵：区分"键不存在"和"值为 None"，支持单次查找
+_MISSING: Any = object()
+
+# 已解析 YAML 的进程级缓存：{(绝对路径, st_mtime_ns, st_size): (解析结果, 扁平索引)}
+# 同一进程内重复构建提供者时只需一次 stat()，文件修改后自动失效
+_YAML_CACHE: dict[tuple[str, int, int], tuple[dict[str, Any], dict[str, Any]]] = {}
+
+
+def flatten_config(config: dict[str, Any]) -> dict[str, Any]:
+    """把嵌套配置摊平为点号键索引。
+
+    中间层的子字典也会收录（如 "completions" -> {...}），
+    使任意深度的 get 都是一次哈希查找。
+    """
+    flat: dict[str, Any] = {}
+    stack: list[tuple[str, dict[str, Any]]] = [("", config)]
+    while stack:
+        prefix, node = stack.pop()
+        for k, v in node.items():
+            dotted = prefix + k
+            flat[dotted] = v
+            if isinstance(v, dict):
+                stack.append((dotted + ".", v))
+    return flat
+
+
+@lru_cache(maxsize=512)
+def _env_key(prefix: str, key: str) -> str:
+    """配置键转环境变量名（带缓存），如 ssh.environments -> PTK_SSH_ENVIRONMENTS。"""
+    return prefix + key.upper().replace(".", "_")
 
 
 @runtime_checkable
@@ -54,16 +94,44 @@ class YamlConfigProvider:
             config_path: YAML 配置文件路径
         """
         self._config_path = Path(config_path)
-        self._config: dict[str, Any] = {}
-        self._load_config()
+        # 懒加载：首次 get/has 时才解析 YAML
+        self._config: dict[str, Any] | None = None
+        # 点号键扁平索引（与 _config 同步构建）
+        self._flat: dict[str, Any] = {}
+
+    def _ensure_loaded(self) -> None:
+        """确保配置已加载（首次访问时才解析文件）。"""
+        if self._config is None:
+            self._load_config()
 
     def _load_config(self) -> None:
-        """加载 YAML 配置文件。"""
-        if self._config_path.exists():
-            with open(self._config_path, encoding="utf-8") as f:
-                self._config = safe_load(f) or {}
-        else:
+        """加载 YAML 配置文件。
+
+        通过 mmap 直接把文件映射给解析器，避免中间的 read() 拷贝。
+        """
+        try:
+            stat = os.stat(self._config_path)
+        except OSError:
             self._config = {}
+            self._flat = {}
+            return
+
+        cache_key = (str(self._config_path.absolute()), stat.st_mtime_ns, stat.st_size)
+        cached = _YAML_CACHE.get(cache_key)
+        if cached is not None:
+            self._config, self._flat = cached
+            return
+
+        with open(self._config_path, "rb") as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    self._config = _yaml_load(mm, Loader=_YamlLoader) or {}
+            except ValueError:
+                # 空文件无法 mmap
+                self._config = {}
+
+        self._flat = flatten_config(self._config)
+        _YAML_CACHE[cache_key] = (self._config, self._flat)
 
     def get(self, key: str, default: Any = None) -> Any:
         """获取配置值。
@@ -75,15 +143,10 @@ class YamlConfigProvider:
         Returns:
             配置值，如果不存在则返回默认值
         """
-        keys = key.split(".")
-        value = self._config
-
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-
+        self._ensure_loaded()
+        value = self._flat.get(key, _MISSING)
+        if value is _MISSING:
+            return default
         return value
 
     def has(self, key: str) -> bool:
@@ -95,7 +158,7 @@ class YamlConfigProvider:
         Returns:
             是否存在
         """
-        return self.get(key) is not None
+        return self.get(key, _MISSING) is not _MISSING
 
 
 class EnvConfigProvider:
@@ -123,8 +186,7 @@ class EnvConfigProvider:
             配置值，如果不存在则返回默认值
         """
         # 转换键名：ssh.environments -> PTK_SSH_ENVIRONMENTS
-        env_key = self._prefix + key.upper().replace(".", "_")
-        return os.getenv(env_key, default)
+        return os.getenv(_env_key(self._prefix, key), default)
 
     def has(self, key: str) -> bool:
         """检查配置键是否存在。
@@ -135,7 +197,7 @@ class EnvConfigProvider:
         Returns:
             是否存在
         """
-        return self.get(key) is not None
+        return self.get(key, _MISSING) is not _MISSING
 
 
 class CompositeConfigProvider:
@@ -171,10 +233,11 @@ class CompositeConfigProvider:
         Returns:
             配置值，从第一个提供者获取，如果不存在则尝试下一个
         """
-        # 反向遍历（优先级高的在后面）
+        # 反向遍历（优先级高的在后面），哨兵单次查找避免 has+get 双重遍历
         for provider in reversed(self._providers):
-            if provider.has(key):
-                return provider.get(key)
+            value = provider.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
 
         return default
 
@@ -187,4 +250,4 @@ class CompositeConfigProvider:
         Returns:
             任一提供者存在即返回 True
         """
-        return any(provider.has(key) for provider in self._providers)
+        return self.get(key, _MISSING) is not _MISSING
@@ -0,0 +1,66 @@
+"""原生 ANSI 转义码常量。
+
+替代 colorama：colorama 的 ``init(autoreset=True)`` 会包装 stdout，
+每次写入都经过一层 Python 代理。现代终端（含 Windows 10+）原生支持
+VT 转义序列，只需在 Windows 上一次性开启 VT 处理即可直接输出。
+
+常量命名与 colorama 的 ``Fore``/``Style`` 保持一致，便于平滑替换。
+"""
+
+import sys
+
+_CSI = "\x1b["
+
+
+class Fore:
+    """前景色转义码（与 colorama.Fore 同名）。"""
+
+    BLACK = _CSI + "30m"
+    RED = _CSI + "31m"
+    GREEN = _CSI + "32m"
+    YELLOW = _CSI + "33m"
+    BLUE = _CSI + "34m"
+    MAGENTA = _CSI + "35m"
+    CYAN = _CSI + "36m"
+    WHITE = _CSI + "37m"
+    LIGHTBLACK_EX = _CSI + "90m"
+    LIGHTRED_EX = _CSI + "91m"
+    LIGHTGREEN_EX = _CSI + "92m"
+    LIGHTYELLOW_EX = _CSI + "93m"
+    LIGHTBLUE_EX = _CSI + "94m"
+    LIGHTMAGENTA_EX = _CSI + "95m"
+    LIGHTCYAN_EX = _CSI + "96m"
+    LIGHTWHITE_EX = _CSI + "97m"
+
+
+class Style:
+    """样式转义码（与 colorama.Style 同名）。"""
+
+    BRIGHT = _CSI + "1m"
+    DIM = _CSI + "2m"
+    NORMAL = _CSI + "22m"
+    RESET_ALL = _CSI + "0m"
+
+
+_vt_enabled = False
+
+
+def enable_vt_on_windows() -> None:
+    """在 Windows 控制台上开启 VT 转义序列处理（幂等）。
+
+    非 Windows 平台为空操作；调用失败静默忽略（旧版控制台会原样
+    显示转义码，与 colorama 未初始化时的行为一致）。
+    """
+    global _vt_enabled
+    if _vt_enabled or sys.platform != "win32":
+        return
+    _vt_enabled = True
+
+    import ctypes
+
+    kernel32 = ctypes.windll.kernel32
+    # STD_OUTPUT_HANDLE = -11; ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+    handle = kernel32.GetStdHandle(-11)
+    mode = ctypes.c_uint32()
+    if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+        kernel32.SetConsoleMode(handle, mode.value | 0x0004)
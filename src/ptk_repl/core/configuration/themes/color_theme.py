@@ -3,13 +3,26 @@
 提供可配置的颜色方案，遵循开闭原则（OCP）。
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any
 
-from colorama import Fore, Style
+from ptk_repl.core.configuration.themes.ansi import Fore, Style
 
+# 预构建并驻留（intern）的常用颜色串：
+# 所有方案实例共享同一批字符串对象，避免每次实例化重新拼接
+_TITLE = sys.intern(Fore.LIGHTCYAN_EX + Style.BRIGHT)
+_SEPARATOR = sys.intern(Fore.LIGHTBLUE_EX)
+_SECTION = sys.intern(Fore.LIGHTMAGENTA_EX + Style.BRIGHT)
+_MODULE = sys.intern(Fore.LIGHTGREEN_EX + Style.BRIGHT)
+_COMMAND = sys.intern(Fore.LIGHTWHITE_EX)
+_ALIAS = sys.intern(Fore.LIGHTYELLOW_EX)
+_PARAM = sys.intern(Fore.LIGHTMAGENTA_EX)
+_ERROR = sys.intern(Fore.LIGHTRED_EX + Style.BRIGHT)
+_RESET = Style.RESET_ALL
 
-@dataclass
+
+@dataclass(slots=True)
 class ColorScheme:
     """颜色方案。
 
@@ -17,27 +30,39 @@ class ColorScheme:
     """
 
     # 标题颜色
-    title: str = field(default_factory=lambda: Fore.LIGHTCYAN_EX + Style.BRIGHT)
+    title: str = _TITLE
     # 分隔线颜色
-    separator: str = field(default_factory=lambda: Fore.LIGHTBLUE_EX)
+    separator: str = _SEPARATOR
     # 小节标题颜色
-    section: str = field(default_factory=lambda: Fore.LIGHTMAGENTA_EX + Style.BRIGHT)
+    section: str = _SECTION
     # 模块名颜色
-    module: str = field(default_factory=lambda: Fore.LIGHTGREEN_EX + Style.BRIGHT)
+    module: str = _MODULE
     # 命令名颜色
-    command: str = field(default_factory=lambda: Fore.LIGHTWHITE_EX)
+    command: str = _COMMAND
     # 别名颜色
-    alias: str = field(default_factory=lambda: Fore.LIGHTYELLOW_EX)
+    alias: str = _ALIAS
     # 描述颜色
-    description: str = field(default_factory=lambda: Fore.LIGHTWHITE_EX)
+    description: str = _COMMAND
     # 参数颜色
-    param: str = field(default_factory=lambda: Fore.LIGHTMAGENTA_EX)
+    param: str = _PARAM
     # 示例颜色
-    example: str = field(default_factory=lambda: Fore.LIGHTBLUE_EX)
+    example: str = _SEPARATOR
     # 标签颜色
-    label: str = field(default_factory=lambda: Fore.LIGHTCYAN_EX + Style.BRIGHT)
+    label: str = _TITLE
     # 错误颜色
-    error: str = field(default_factory=lambda: Fore.LIGHTRED_EX + Style.BRIGHT)
+    error: str = _ERROR
+    # 颜色类型 -> 颜色串查找表（__post_init__ 填充，不参与比较/repr）
+    _colors: dict[str, str] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+
+    def __post_init__(self) -> None:
+        """预建颜色类型 -> 颜色串的查找表（单次哈希查找替代 getattr）。"""
+        self._colors = {
+            name: getattr(self, name)
+            for name in self.__dataclass_fields__
+            if name != "_colors"
+        }
 
     def get_color(self, color_type: str) -> str:
         """获取指定类型的颜色。
@@ -48,7 +73,7 @@ class ColorScheme:
         Returns:
             颜色字符串（ANSI 转义码）
         """
-        return getattr(self, color_type, "")
+        return self._colors.get(color_type, "")
 
     def color_text(self, text: str, color_type: str) -> str:
         """为文本添加颜色。
@@ -60,8 +85,7 @@ class ColorScheme:
         Returns:
             着色后的文本（包含重置序列）
         """
-        color = self.get_color(color_type)
-        return f"{color}{text}{Style.RESET_ALL}"
+        return "".join((self.get_color(color_type), text, _RESET))
 
     @classmethod
     def from_dict(cls, config: dict[str, Any]) -> "ColorScheme":
@@ -85,7 +109,7 @@ class ColorScheme:
         return cls()
 
 
-@dataclass
+@dataclass(slots=True)
 class Theme:
     """主题配置。
 
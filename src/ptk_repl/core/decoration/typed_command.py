@@ -10,63 +10,80 @@ if TYPE_CHECKING:
     from ptk_repl.core.interfaces.cli_context import ICliContext
 
 
-def _parse_args_to_dict(arg_str: str, model_cls: type[BaseModel]) -> dict[str, Any]:
-    """解析参数字符串为字典。
+def _compile_parser(model_cls: type[BaseModel]) -> Callable[[str], dict[str, Any]]:
+    """在装饰时为模型特化参数解析器（部分求值）。
+
+    字段名、长选项映射和位置参数顺序在装饰时烘焙进闭包，
+    每次命令调用不再重新解读 model_fields。
 
     Args:
-        arg_str: 参数字符串
         model_cls: Pydantic 模型类
 
     Returns:
-        参数字典
+        解析函数 arg_str -> 参数字典
     """
     import shlex
 
-    try:
-        tokens = shlex.split(arg_str)
-    except ValueError:
-        tokens = arg_str.split()
-
-    kwargs: dict[str, Any] = {}
-    i = 0
-    fields = model_cls.model_fields
-
-    while i < len(tokens):
-        token = tokens[i]
-
-        if token.startswith("--"):
-            # 长选项
-            key = token[2:].replace("-", "_")
-            if key in fields:
-                if i + 1 < len(tokens) and not tokens[i + 1].startswith("-"):
-                    kwargs[key] = tokens[i + 1]
-                    i += 2
+    fields: tuple[str, ...] = tuple(model_cls.model_fields)
+    # 长选项表：同时接受连字符和下划线两种拼写
+    long_map: dict[str, str] = {f: f for f in fields}
+    long_map.update({f.replace("_", "-"): f for f in fields})
+    # 短选项表：首字符 -> 首个匹配字段（保持"首个匹配"语义）
+    short_map: dict[str, str] = {}
+    for f in fields:
+        short_map.setdefault(f[0], f)
+
+    def parse(arg_str: str) -> dict[str, Any]:
+        try:
+            tokens = shlex.split(arg_str)
+        except ValueError:
+            tokens = arg_str.split()
+
+        kwargs: dict[str, Any] = {}
+        i = 0
+        n = len(tokens)
+
+        while i < n:
+            token = tokens[i]
+            # 只切一次前两个字符完成分类，替代多次 startswith 方法调用
+            head = token[:2]
+
+            if head == "--":
+                # 长选项
+                field_name = long_map.get(token[2:])
+                if field_name is not None:
+                    if i + 1 < n and not tokens[i + 1].startswith("-"):
+                        kwargs[field_name] = tokens[i + 1]
+                        i += 2
+                    else:
+                        kwargs[field_name] = True
+                        i += 1
                 else:
-                    kwargs[key] = True
+                    # 未知长选项：跳过
                     i += 1
-        elif token.startswith("-") and len(token) == 2:
-            # 短选项
-            key = token[1]
-            # 查找匹配的字段
-            matching_fields = [f for f in fields if f.startswith(key)]
-            if matching_fields:
-                field_name = matching_fields[0]
-                if i + 1 < len(tokens) and not tokens[i + 1].startswith("-"):
-                    kwargs[field_name] = tokens[i + 1]
-                    i += 2
+            elif len(token) == 2 and head[0] == "-":
+                # 短选项（装饰时预建的首字符表，单次查找）
+                field_name = short_map.get(token[1])
+                if field_name is not None:
+                    if i + 1 < n and not tokens[i + 1].startswith("-"):
+                        kwargs[field_name] = tokens[i + 1]
+                        i += 2
+                    else:
+                        kwargs[field_name] = True
+                        i += 1
                 else:
-                    kwargs[field_name] = True
                     i += 1
             else:
+                # 位置参数：填入首个未赋值字段
+                for f in fields:
+                    if f not in kwargs:
+                        kwargs[f] = token
+                        break
                 i += 1
-        else:
-            # 位置参数
-            positional = [f for f in fields if f not in kwargs]
-            if positional:
-                kwargs[positional[0]] = token
-            i += 1
 
-    return kwargs
+        return kwargs
+
+    return parse
 
 
 def typed_command[T: BaseModel](
@@ -99,10 +116,24 @@ def typed_command[T: BaseModel](
     """
 
     def decorator(func: Callable[..., Any]) -> Callable[["ICliContext", str], None]:
+        # 装饰时编译一次解析器（字段表烘焙进闭包）
+        parse_args = _compile_parser(model_cls)
+
+        # 全默认值单例：字段全部可省时（如 TailArgs/DisconnectArgs），
+        # 空参数调用直接复用，跳过整次 Pydantic 校验；
+        # 有必填字段的模型构造失败，走常规路径报错
+        try:
+            default_args: T | None = model_cls()
+        except ValidationError:
+            default_args = None
+
         @wraps(func)
         def wrapper(cli_context: "ICliContext", arg_str: str) -> None:
             try:
-                kwargs = _parse_args_to_dict(arg_str, model_cls)
+                if default_args is not None and not arg_str.strip():
+                    func(default_args)
+                    return
+                kwargs = parse_args(arg_str)
                 args = model_cls(**kwargs)
                 func(args)  # func 作为闭包，已经能访问外部的 self
             except ValidationError as e:
@@ -5,8 +5,14 @@
 
 from typing import Protocol, runtime_checkable
 
+from ptk_repl.core.configuration.themes.ansi import Fore, Style, enable_vt_on_windows
 from ptk_repl.core.exceptions import CLIException
 
+# 一次性开启 VT 处理并缓存错误格式片段
+enable_vt_on_windows()
+_ERR_PREFIX = Fore.LIGHTRED_EX + Style.BRIGHT
+_ERR_RESET = Style.RESET_ALL
+
 
 @runtime_checkable
 class IErrorHandler(Protocol):
@@ -63,13 +69,10 @@ class CLIErrorHandler:
     def handle(self, error: Exception) -> None:
         """处理 CLI 异常。"""
         if isinstance(error, CLIException):
-            # 使用红色文本显示错误
-            from colorama import Fore, Style, init
-
-            init(autoreset=True)
-            print(f"{Fore.LIGHTRED_EX}{Style.BRIGHT}错误: {error}{Style.RESET_ALL}")
+            # 使用红色文本显示错误（颜色片段在模块加载时已缓存）
+            print(f"{_ERR_PREFIX}错误: {error}{_ERR_RESET}")
             if error.details:
-                print(f"{Fore.LIGHTRED_EX}详情: {error.details}{Style.RESET_ALL}")
+                print(f"{Fore.LIGHTRED_EX}详情: {error.details}{_ERR_RESET}")
 
 
 class ErrorHandlerChain:
@@ -85,6 +88,17 @@ class ErrorHandlerChain:
             handlers: 错误处理器列表（按优先级排序）
         """
         self._handlers = handlers
+        # 按异常类型的快速分发表：命中时跳过逐个 can_handle 调用
+        self._by_type: dict[type, IErrorHandler] = {}
+
+    def register(self, exc_type: type[BaseException], handler: IErrorHandler) -> None:
+        """按异常类型注册处理器（快速分发路径）。
+
+        Args:
+            exc_type: 异常类型（子类沿 MRO 自动命中）
+            handler: 错误处理器
+        """
+        self._by_type[exc_type] = handler
 
     def handle(self, error: Exception) -> bool:
         """处理错误。
@@ -95,6 +109,15 @@ class ErrorHandlerChain:
         Returns:
             是否成功处理（如果有处理器能处理则返回 True）
         """
+        # 快速路径：沿 MRO 查分发表（通常 2-3 次字典查找）
+        if self._by_type:
+            for cls in type(error).__mro__:
+                handler = self._by_type.get(cls)
+                if handler is not None:
+                    handler.handle(error)
+                    return True
+
+        # 慢速路径：逐个询问 can_handle（保持 Protocol 兼容）
         for handler in self._handlers:
             if handler.can_handle(error):
                 handler.handle(error)
@@ -116,9 +139,16 @@ def get_default_error_handler_chain() -> ErrorHandlerChain:
     Returns:
         配置好的错误处理链
     """
-    return ErrorHandlerChain(
+    cli_handler = CLIErrorHandler()
+    base_handler = BaseErrorHandler()
+
+    chain = ErrorHandlerChain(
         [
-            CLIErrorHandler(),  # 优先处理 CLI 异常
-            BaseErrorHandler(),  # 处理其他所有异常
+            cli_handler,  # 优先处理 CLI 异常
+            base_handler,  # 处理其他所有异常
         ]
     )
+    # 类型分发表：错误分发变成 MRO 上的字典查找
+    chain.register(CLIException, cli_handler)
+    chain.register(Exception, base_handler)
+    return chain
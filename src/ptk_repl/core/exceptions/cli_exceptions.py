@@ -3,6 +3,11 @@
 提供统一的异常类型，便于错误处理和调试。
 """
 
+import types
+
+# 无详情异常共享的只读空映射，避免每次抛异常都分配一个空字典
+_EMPTY_DETAILS: types.MappingProxyType = types.MappingProxyType({})
+
 
 class CLIException(Exception):
     """CLI 异常基类。
@@ -10,16 +15,19 @@ class CLIException(Exception):
     所有 CLI 相关异常的基类。
     """
 
+    __slots__ = ("message", "details")
+
     def __init__(self, message: str, details: dict | None = None) -> None:
         """初始化 CLI 异常。
 
         Args:
             message: 错误消息
-            details: 额外的错误详情（可选）
+            details: 额外的错误详情（可选）；未提供时共享只读空映射，
+                需要修改详情的调用方应传入自己的字典
         """
         super().__init__(message)
         self.message = message
-        self.details = details or {}
+        self.details = details if details else _EMPTY_DETAILS
 
     def __str__(self) -> str:
         """返回错误消息。"""
@@ -34,7 +42,7 @@ class CommandException(CLIException):
     命令执行过程中发生的错误。
     """
 
-    pass
+    __slots__ = ()
 
 
 class ModuleException(CLIException):
@@ -43,7 +51,7 @@ class ModuleException(CLIException):
     模块加载、初始化或执行过程中发生的错误。
     """
 
-    pass
+    __slots__ = ()
 
 
 class ValidationException(CLIException):
@@ -52,7 +60,7 @@ class ValidationException(CLIException):
     命令参数验证失败。
     """
 
-    pass
+    __slots__ = ()
 
 
 class ConnectionException(CLIException):
@@ -61,7 +69,7 @@ class ConnectionException(CLIException):
     SSH、数据库等连接失败。
     """
 
-    pass
+    __slots__ = ()
 
 
 class ConfigurationException(CLIException):
@@ -70,4 +78,4 @@ class ConfigurationException(CLIException):
     配置加载、解析或验证失败。
     """
 
-    pass
+    __slots__ = ()
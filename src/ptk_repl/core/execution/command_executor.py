@@ -1,6 +1,7 @@
 """命令执行器。"""
 
 import shlex
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from ptk_repl.core.interfaces.cli_context import ICliContext
@@ -11,6 +12,18 @@ if TYPE_CHECKING:
     pass
 
 
+@lru_cache(maxsize=256)
+def _split_command(command_str: str) -> tuple[str, ...]:
+    """分词命令字符串（带缓存，历史重放/重试时直接命中）。
+
+    无引号、无转义的常见输入走 str.split 快路径，
+    其余情况退回完整的 shlex 词法分析。
+    """
+    if "'" not in command_str and '"' not in command_str and "\\" not in command_str:
+        return tuple(command_str.split())
+    return tuple(shlex.split(command_str))
+
+
 class CommandExecutor:
     """命令执行器。
 
@@ -42,7 +55,7 @@ class CommandExecutor:
         Args:
             command_str: 命令字符串
         """
-        tokens = shlex.split(command_str)
+        tokens = _split_command(command_str)
         if not tokens:
             return
 
@@ -103,26 +116,24 @@ class CommandExecutor:
                 self._cli_context.poutput(f"  • {full_cmd}")
             return
 
-        # 2. 尝试从懒加载模块中查找（通过别名）
-        for lazy_module_name, module_cls in self._module_loader.lazy_modules.items():
-            # 创建临时模块实例来检查别名
-            temp_module = module_cls()
-            if hasattr(temp_module, "aliases") and temp_module.aliases == module_name:
-                # 找到了！触发懒加载
-                self._module_loader.ensure_module_loaded(lazy_module_name)
-
-                # 重新从 registry 获取模块（现在已加载）
-                module = self._registry.get_module(lazy_module_name)
-                if module:
-                    commands = self._registry.list_module_commands(lazy_module_name)
-                    self._cli_context.poutput(f"{module.name} 模块 - {module.description}")
-                    self._cli_context.poutput("\n可用命令:")
-                    for cmd in commands:
-                        if lazy_module_name == "core":
-                            full_cmd = cmd
-                        else:
-                            full_cmd = f"{lazy_module_name} {cmd}"
-                        self._cli_context.poutput(f"  • {full_cmd}")
-                return
+        # 2. 尝试从懒加载模块中查找（通过别名索引，O(1) 且无需临时实例）
+        lazy_module_name = self._module_loader.find_by_alias(module_name)
+        if lazy_module_name is not None:
+            # 找到了！触发懒加载
+            self._module_loader.ensure_module_loaded(lazy_module_name)
+
+            # 重新从 registry 获取模块（现在已加载）
+            module = self._registry.get_module(lazy_module_name)
+            if module:
+                commands = self._registry.list_module_commands(lazy_module_name)
+                self._cli_context.poutput(f"{module.name} 模块 - {module.description}")
+                self._cli_context.poutput("\n可用命令:")
+                for cmd in commands:
+                    if lazy_module_name == "core":
+                        full_cmd = cmd
+                    else:
+                        full_cmd = f"{lazy_module_name} {cmd}"
+                    self._cli_context.poutput(f"  • {full_cmd}")
+            return
 
         self._cli_context.perror(f"未知命令: {module_name}")
@@ -7,20 +7,26 @@
 - 颜色渲染
 """
 
+import os
+import sys
+from collections import defaultdict
 from collections.abc import Callable
-from typing import TYPE_CHECKING, Any, cast
-
-from colorama import init
+from typing import TYPE_CHECKING, Any, ClassVar
 
+from ptk_repl.core.configuration.themes.ansi import (
+    enable_vt_on_windows as _enable_vt_on_windows,
+)
 from ptk_repl.core.configuration.themes.color_theme import ColorScheme
 
-# 初始化 colorama
-init(autoreset=True)
-
 if TYPE_CHECKING:
     from ptk_repl.cli import PromptToolkitCLI
 
 
+def _color_enabled() -> bool:
+    """判断是否输出颜色（非 TTY 或设置了 NO_COLOR 时跳过）。"""
+    return sys.stdout.isatty() and not os.environ.get("NO_COLOR")
+
+
 class HelpFormatter:
     """帮助信息格式化器。
 
@@ -31,6 +37,20 @@ class HelpFormatter:
     - 颜色渲染
     """
 
+    # 模块短别名映射（类常量，避免每次调用重建）
+    _SHORT_ALIASES: ClassVar[dict[str, str]] = {
+        "database": "db",
+        "file": "fs",
+    }
+
+    # 静态提示文本（总览帮助尾部，与颜色无关）
+    _TIP_LINES = (
+        "提示:",
+        "  • 使用 'help <command>' 查看命令详细帮助",
+        "  • 使用 'help <module>' 查看模块所有命令",
+        "  • 输入 'exit' 或按 Ctrl+D 退出",
+    )
+
     def __init__(self, cli: "PromptToolkitCLI", color_scheme: ColorScheme | None = None) -> None:
         """初始化帮助格式化器。
 
@@ -41,6 +61,15 @@ class HelpFormatter:
         self.cli = cli
         self.registry = cli.registry
         self.color_scheme = color_scheme or ColorScheme.default()
+        # 缓存绑定方法，省去每次着色的两级属性查找
+        self._ct = self.color_scheme.color_text
+        # 颜色方案对实例固定：分隔线/小节标题/标签着色一次后复用
+        self._sep: str | None = None
+        self._section_cache: dict[str, str] = {}
+        self._label_cache: dict[str, str] = {}
+        # 按处理函数缓存提取结果（docstring/模型字段在运行期不变）
+        self._description_cache: dict[Callable, str] = {}
+        self._parameter_cache: dict[Callable, list[dict[str, Any]]] = {}
 
     def extract_command_description(self, handler: Callable) -> str:
         """提取命令描述。
@@ -51,7 +80,12 @@ class HelpFormatter:
         Returns:
             命令描述字符串
         """
+        cached = self._description_cache.get(handler)
+        if cached is not None:
+            return cached
+
         # 1. 尝试从 typed_command 包装器提取原始函数
+        doc: str | None
         if hasattr(handler, "_original_func"):
             original_func = handler._original_func
             doc = original_func.__doc__
@@ -60,9 +94,12 @@ class HelpFormatter:
 
         # 2. 清理文档字符串
         if doc:
-            text = doc.strip().split("\n")[0]
-            return cast(str, text)  # 取第一行
-        return "无描述"
+            description = doc.strip().split("\n")[0]  # 取第一行
+        else:
+            description = "无描述"
+
+        self._description_cache[handler] = description
+        return description
 
     def extract_parameter_info(self, handler: Callable) -> list[dict[str, Any]]:
         """提取参数信息（从 Pydantic 模型）。
@@ -73,6 +110,10 @@ class HelpFormatter:
         Returns:
             参数信息列表 [{name, description, required, default}, ...]
         """
+        cached = self._parameter_cache.get(handler)
+        if cached is not None:
+            return cached
+
         params = []
 
         # 检查是否使用 typed_command
@@ -90,6 +131,7 @@ class HelpFormatter:
                     }
                     params.append(param)
 
+        self._parameter_cache[handler] = params
         return params
 
     def get_command_aliases(self, module_name: str, command_name: str) -> list[str]:
@@ -103,13 +145,7 @@ class HelpFormatter:
             别名列表
         """
         full_command = f"{module_name} {command_name}" if module_name != "core" else command_name
-        aliases = []
-
-        for alias, target in self.registry._alias_map.items():
-            if target == full_command:
-                aliases.append(alias)
-
-        return aliases
+        return self.registry.get_aliases_for(full_command)
 
     def format_overview_help(self) -> str:
         """格式化总览帮助。
@@ -117,29 +153,30 @@ class HelpFormatter:
         Returns:
             格式化后的帮助字符串
         """
+        # 一次取出全部命令并按模块分桶，替代逐命令的 get_command_info 查找
+        by_module: dict[str, dict[str, Callable]] = defaultdict(dict)
+        for module_name, command_name, handler in self.registry.get_all_commands().values():
+            by_module[module_name][command_name] = handler
+
         lines = []
 
-        # 核心命令
+        # 核心命令（命令顺序来自注册表的排序缓存）
+        core_handlers = by_module.get("core", {})
         lines.append(self._section_header("核心命令"))
-        core_commands = self.registry.list_module_commands("core")
-
-        for cmd in sorted(core_commands):
-            cmd_info = self.registry.get_command_info(cmd)
-            if cmd_info:
-                _, _, handler = cmd_info
-                description = self.extract_command_description(handler)
-                aliases = self.get_command_aliases("core", cmd)
-                lines.append(self._format_command_item(cmd, description, aliases))
+        for cmd in self.registry.list_module_commands_sorted("core"):
+            description = self.extract_command_description(core_handlers[cmd])
+            aliases = self.get_command_aliases("core", cmd)
+            lines.append(self._format_command_item(cmd, description, aliases))
 
         lines.append("")
 
         # 模块命令
-        modules = [m for m in self.registry.list_modules() if m.name != "core"]
+        modules = [m for m in self.registry.list_modules_sorted() if m.name != "core"]
         if modules:
             lines.append(self._section_header("模块命令"))
 
-            for module in sorted(modules, key=lambda m: m.name):
-                commands = self.registry.list_module_commands(module.name)
+            for module in modules:
+                commands = by_module.get(module.name)
                 if not commands:
                     continue
 
@@ -156,25 +193,18 @@ class HelpFormatter:
                 lines.append(f"  {self._color_text(module_title, 'module'):<20} {module_desc}")
 
                 # 模块子命令
-                for cmd in sorted(commands):
-                    cmd_info = self.registry.get_command_info(f"{module.name} {cmd}")
-                    if cmd_info:
-                        _, _, handler = cmd_info
-                        description = self.extract_command_description(handler)
-                        aliases = self.get_command_aliases(module.name, cmd)
+                for cmd in self.registry.list_module_commands_sorted(module.name):
+                    description = self.extract_command_description(commands[cmd])
+                    aliases = self.get_command_aliases(module.name, cmd)
 
-                        # 格式化命令项（缩进）
-                        cmd_line = self._format_command_item(cmd, description, aliases, indent=4)
-                        lines.append(cmd_line)
+                    # 格式化命令项（缩进）
+                    lines.append(self._format_command_item(cmd, description, aliases, indent=4))
 
                 lines.append("")
 
         # 提示
         lines.append(self._separator())
-        lines.append("提示:")
-        lines.append("  • 使用 'help <command>' 查看命令详细帮助")
-        lines.append("  • 使用 'help <module>' 查看模块所有命令")
-        lines.append("  • 输入 'exit' 或按 Ctrl+D 退出")
+        lines.extend(self._TIP_LINES)
         lines.append(self._separator())
 
         return "\n".join(lines)
@@ -201,20 +231,20 @@ class HelpFormatter:
         parameters = self.extract_parameter_info(handler)
         aliases = self.get_command_aliases(module_name, command_name)
 
-        lines = []
-
-        # 标题
-        lines.append(self._separator())
-        lines.append(self._title(f"{full_command} - {description}"))
-        lines.append(self._separator())
-        lines.append("")
-
-        # 描述
-        lines.append(self._label("描述"))
-        lines.append(f"  {description}")
-        lines.append("")
-
-        # 参数
+        # 标题 + 描述（固定结构，一次性构造初始列表）
+        sep = self._separator()
+        lines = [
+            sep,
+            self._title(f"{full_command} - {description}"),
+            sep,
+            "",
+            self._label("描述"),
+            f"  {description}",
+            "",
+        ]
+
+        # 参数（打印时顺便收集必需参数，供示例复用）
+        required_params: list[dict[str, Any]] = []
         if parameters:
             lines.append(self._label("参数"))
             for param in parameters:
@@ -222,6 +252,7 @@ class HelpFormatter:
                 param_str += f"{param['description']:<30}"
 
                 if param["required"]:
+                    required_params.append(param)
                     param_str += " [必需]"
                 else:
                     default_str = str(param["default"]) if param["default"] is not None else "None"
@@ -233,28 +264,21 @@ class HelpFormatter:
         # 别名
         if aliases:
             lines.append(self._label("别名"))
-            for alias in aliases:
-                lines.append(f"  • {self._color_text(alias, 'alias')}")
+            lines.extend(f"  • {self._color_text(alias, 'alias')}" for alias in aliases)
             lines.append("")
         else:
-            lines.append(self._label("别名"))
-            lines.append("  无")
-            lines.append("")
+            lines += (self._label("别名"), "  无", "")
 
         # 示例
-        lines.append(self._label("使用示例"))
-        lines.append(f"  {self._color_text(full_command, 'command')}")
-        if parameters:
+        lines += (self._label("使用示例"), f"  {self._color_text(full_command, 'command')}")
+        if required_params:
             # 生成带参数的示例
-            required_params = [p for p in parameters if p["required"]]
-            if required_params:
-                example = "  " + full_command
-                for param in required_params[:2]:  # 最多显示2个必需参数
-                    example += f" <{param['name']}>"
-                lines.append(self._color_text(example, "example"))
+            example = "  " + full_command
+            for param in required_params[:2]:  # 最多显示2个必需参数
+                example += f" <{param['name']}>"
+            lines.append(self._color_text(example, "example"))
 
-        lines.append("")
-        lines.append(self._separator())
+        lines += ("", sep)
 
         return "\n".join(lines)
 
@@ -288,7 +312,7 @@ class HelpFormatter:
         # 命令列表
         lines.append(self._label("可用命令"))
 
-        for cmd in sorted(commands):
+        for cmd in self.registry.list_module_commands_sorted(module_name):
             cmd_info = self.registry.get_command_info(f"{module_name} {cmd}")
             if cmd_info:
                 _, _, handler = cmd_info
@@ -301,11 +325,13 @@ class HelpFormatter:
                 if aliases:
                     cmd_display += f" ({', '.join(aliases)})"
 
-                # 参数签名
+                # 参数签名（单次遍历完成必需/可选划分）
                 param_str = ""
                 if parameters:
-                    required_params = [p for p in parameters if p["required"]]
-                    optional_params = [p for p in parameters if not p["required"]]
+                    required_params: list[dict[str, Any]] = []
+                    optional_params: list[dict[str, Any]] = []
+                    for p in parameters:
+                        (required_params if p["required"] else optional_params).append(p)
 
                     if required_params:
                         param_str += " " + " ".join([f"<{p['name']}>" for p in required_params])
@@ -326,8 +352,10 @@ class HelpFormatter:
     # 辅助格式化方法
 
     def _separator(self) -> str:
-        """生成分隔线。"""
-        return self._color_text("━" * 65, "separator")
+        """生成分隔线（首次着色后复用）。"""
+        if self._sep is None:
+            self._sep = self._color_text("━" * 65, "separator")
+        return self._sep
 
     def _title(self, text: str) -> str:
         """生成标题。"""
@@ -335,12 +363,20 @@ class HelpFormatter:
         return self._color_text(f"  {centered}", "title")
 
     def _section_header(self, text: str) -> str:
-        """生成小节标题。"""
-        return f"  {self._color_text(text, 'section')}"
+        """生成小节标题（按文本缓存）。"""
+        cached = self._section_cache.get(text)
+        if cached is None:
+            cached = f"  {self._color_text(text, 'section')}"
+            self._section_cache[text] = cached
+        return cached
 
     def _label(self, text: str) -> str:
-        """生成标签。"""
-        return f"  {self._color_text(text, 'label')}"
+        """生成标签（按文本缓存）。"""
+        cached = self._label_cache.get(text)
+        if cached is None:
+            cached = f"  {self._color_text(text, 'label')}"
+            self._label_cache[text] = cached
+        return cached
 
     def _format_command_item(
         self, command: str, description: str, aliases: list[str] | None = None, indent: int = 2
@@ -356,37 +392,21 @@ class HelpFormatter:
         Returns:
             格式化后的命令行
         """
-        import re
-
-        # 用于计算去除 ANSI 码后的实际显示长度
-        ansi_escape = re.compile(r"\x1B\[@-_][0-9;]*[0-9;]*[0-9;]*m")
-
-        def visible_length(text: str) -> int:
-            """��算文本的可见长度（去除 ANSI 颜色码）。"""
-            return len(ansi_escape.sub("", text))
-
-        prefix = " " * indent
-
         # 命令名（带颜色）
         cmd_colored = self._color_text(command, "command")
 
-        # 别名（带颜色）
-        alias_str = ""
+        # 别名（带颜色）；显示宽度按原始文本长度计算，不受颜色码影响
         if aliases:
             colored_aliases = [self._color_text(a, "alias") for a in aliases]
             alias_str = f" ({', '.join(colored_aliases)})"
+            visible = len(command) + len(", ".join(aliases)) + 3  # " (" + ")"
+        else:
+            alias_str = ""
+            visible = len(command)
 
-        # 计算实际显示宽度
-        cmd_visible_len = len(command)
-        alias_visible_len = len(f" ({', '.join(aliases)})") if aliases else 0
-        total_visible_len = cmd_visible_len + alias_visible_len
-
-        # 计算需要填充的空格数（目标宽度 30）
-        target_width = 30
-        padding = " " * max(0, target_width - total_visible_len)
-
-        # 组合最终字符串
-        return f"{prefix}{cmd_colored}{alias_str}{padding} {description}"
+        # 填充至目标宽度 30
+        pad = max(0, 30 - visible)
+        return f"{' ' * indent}{cmd_colored}{alias_str}{' ' * pad} {description}"
 
     def _color_text(self, text: str, color_type: str) -> str:
         """为文本添加颜色。
@@ -396,9 +416,12 @@ class HelpFormatter:
             color_type: 颜色类型
 
         Returns:
-            带颜色代码的文本
+            带颜色代码的文本（非 TTY 输出时返回原文）
         """
-        return self.color_scheme.color_text(text, color_type)
+        if not _color_enabled():
+            return text
+        _enable_vt_on_windows()
+        return self._ct(text, color_type)
 
     def _error(self, text: str) -> str:
         """生成错误消息。
@@ -420,8 +443,4 @@ class HelpFormatter:
         Returns:
             短别名，如果未定义则返回 None
         """
-        short_aliases = {
-            "database": "db",
-            "file": "fs",
-        }
-        return short_aliases.get(module_name)
+        return self._SHORT_ALIASES.get(module_name)
@@ -2,15 +2,33 @@
 
 本模块包含项目中的所有 Protocol 接口定义，使用 Protocol 而非 ABC
 以支持鸭子类型和更灵活的接口实现。
+
+接口按需懒加载（PEP 562）：只有真正访问的接口才会导入对应子模块，
+缩短启动时的导入链。
 """
 
-from ptk_repl.core.interfaces.cli_context import ICliContext
-from ptk_repl.core.interfaces.command_resolver import ICommandResolver
-from ptk_repl.core.interfaces.module_discoverer import IModuleDiscoverer
-from ptk_repl.core.interfaces.module_loader import IModuleLoader
-from ptk_repl.core.interfaces.module_register import IModuleRegister
-from ptk_repl.core.interfaces.prompt_provider import IPromptProvider
-from ptk_repl.core.interfaces.registry import IRegistry
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ptk_repl.core.interfaces.cli_context import ICliContext
+    from ptk_repl.core.interfaces.command_resolver import ICommandResolver
+    from ptk_repl.core.interfaces.module_discoverer import IModuleDiscoverer
+    from ptk_repl.core.interfaces.module_loader import IModuleLoader
+    from ptk_repl.core.interfaces.module_register import IModuleRegister
+    from ptk_repl.core.interfaces.prompt_provider import IPromptProvider
+    from ptk_repl.core.interfaces.registry import IRegistry
+
+# 接口名 -> 定义模块（懒加载映射）
+_LAZY = {
+    "ICliContext": "ptk_repl.core.interfaces.cli_context",
+    "ICommandResolver": "ptk_repl.core.interfaces.command_resolver",
+    "IModuleDiscoverer": "ptk_repl.core.interfaces.module_discoverer",
+    "IModuleLoader": "ptk_repl.core.interfaces.module_loader",
+    "IModuleRegister": "ptk_repl.core.interfaces.module_register",
+    "IPromptProvider": "ptk_repl.core.interfaces.prompt_provider",
+    "IRegistry": "ptk_repl.core.interfaces.registry",
+}
 
 __all__ = [
     "ICliContext",
@@ -21,3 +39,13 @@ __all__ = [
     "IPromptProvider",
     "IRegistry",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """按需导入接口（PEP 562），并缓存到模块命名空间。"""
+    module_path = _LAZY.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
@@ -1,9 +1,11 @@
 """模块加载器接口。"""
 
+from collections.abc import Mapping
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
     from ptk_repl.core.base import CommandModule
+    from ptk_repl.core.loaders.module_discovery_service import ModuleClassRef
 
 
 @runtime_checkable
@@ -57,12 +59,23 @@ class IModuleLoader(Protocol):
         """
         ...
 
+    def find_by_alias(self, alias: str) -> str | None:
+        """通过别名查找懒加载模块名（O(1) 索引查找）。
+
+        Args:
+            alias: 模块别名
+
+        Returns:
+            模块名称，如果未找到则返回 None
+        """
+        ...
+
     @property
-    def loaded_modules(self) -> dict[str, "CommandModule"]:
-        """已加载的模块字典。"""
+    def loaded_modules(self) -> Mapping[str, "CommandModule"]:
+        """已加载的模块映射（只读视图）。"""
         ...
 
     @property
-    def lazy_modules(self) -> dict[str, type]:
-        """懒加载模块字典（未加载的模块类）。"""
+    def lazy_modules(self) -> dict[str, "ModuleClassRef"]:
+        """懒加载模块字典（未加载的模块类或其延迟引用）。"""
         ...
@@ -1,6 +1,6 @@
 """注册表公共接口。"""
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
@@ -18,19 +18,30 @@ class IRegistry(Protocol):
     提供对命令注册表的完整访问接口。
     """
 
-    def get_all_commands(self) -> dict[str, CommandInfo]:
-        """获取所有命令的副本。
+    def get_all_commands(self) -> Mapping[str, CommandInfo]:
+        """获取所有命令的只读视图（零拷贝）。
 
         Returns:
-            命令字典的副本 {command_name: command_info}
+            底层命令字典的只读视图 {command_name: command_info}
         """
         ...
 
-    def get_all_aliases(self) -> dict[str, str]:
-        """获取所有别名的副本。
+    def get_all_aliases(self) -> Mapping[str, str]:
+        """获取所有别名的只读视图（零拷贝）。
 
         Returns:
-            别名字典的副本 {alias: command_name}
+            底层别名字典的只读视图 {alias: command_name}
+        """
+        ...
+
+    def get_aliases_for(self, command: str) -> list[str]:
+        """获取命令的所有别名。
+
+        Args:
+            command: 完整命令（如 "database connect" 或 "help"）
+
+        Returns:
+            别名列表，没有别名时返回空列表
         """
         ...
 
@@ -1,12 +1,13 @@
 """模块加载器包。"""
 
 from ptk_repl.core.loaders.lazy_module_tracker import LazyModuleTracker
-from ptk_repl.core.loaders.module_discovery_service import ModuleDiscoveryService
+from ptk_repl.core.loaders.module_discovery_service import LazyClassRef, ModuleDiscoveryService
 from ptk_repl.core.loaders.module_lifecycle_manager import ModuleLifecycleManager
 from ptk_repl.core.loaders.module_register import ModuleRegister
 from ptk_repl.core.loaders.unified_module_loader import UnifiedModuleLoader
 
 __all__ = [
+    "LazyClassRef",
     "LazyModuleTracker",
     "ModuleDiscoveryService",
     "ModuleLifecycleManager",
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ptk_repl.core.base import CommandModule
+    from ptk_repl.core.loaders.module_discovery_service import LazyClassRef, ModuleClassRef
 
 
 class LazyModuleTracker:
@@ -15,29 +16,55 @@ class LazyModuleTracker:
 
     def __init__(self) -> None:
         """初始化追踪器。"""
-        self._lazy_modules: dict[str, type[CommandModule]] = {}
+        self._lazy_modules: dict[str, ModuleClassRef] = {}
         self._loaded_modules: set[str] = set()
         self._alias_to_module: dict[str, str] = {}
-
-    def add_lazy_module(self, module_name: str, module_cls: type[CommandModule]) -> None:
+        # 延迟类引用（LazyClassRef）的别名待解析队列：
+        # 元数据登记时不导入模块，别名查找未命中时才按需解析
+        self._pending_alias_sources: dict[str, LazyClassRef] = {}
+        # 已加载集合的版本号：每次 mark_as_loaded +1，供读取方缓存失效
+        self._version = 0
+
+    def add_lazy_module(
+        self, module_name: str, module_cls: "type[CommandModule] | LazyClassRef"
+    ) -> None:
         """添加懒加载模块。
 
         Args:
             module_name: 模块名称
-            module_cls: 模块类
+            module_cls: 模块类或延迟类引用（LazyClassRef）
         """
         self._lazy_modules[module_name] = module_cls
 
-        # 缓存别名信息（创建临时实例检查）
-        try:
-            temp_instance = module_cls()
-            if hasattr(temp_instance, "aliases") and temp_instance.aliases:
-                # 为每个别名创建映射
-                for alias in temp_instance.aliases:
+        if not isinstance(module_cls, type):
+            # 延迟类引用：别名信息要等导入后才可知，先挂起
+            self._pending_alias_sources[module_name] = module_cls
+            return
+
+        self._register_aliases(module_name, module_cls)
+
+    def _register_aliases(self, module_name: str, module_cls: type["CommandModule"]) -> None:
+        """从模块类读取并登记别名映射。
+
+        直接从类属性读取，无需实例化
+        （构造函数可能导入 ssh/db 等重量级依赖）。
+        """
+        aliases = getattr(module_cls, "aliases", None)
+        if isinstance(aliases, property):
+            # 子类仍以 property 声明别名：退化为一次临时实例读取
+            try:
+                aliases = module_cls().aliases
+            except Exception:
+                aliases = None
+
+        if aliases:
+            if isinstance(aliases, str):
+                # 单个别名（如 "db"）
+                self._alias_to_module[aliases] = module_name
+            else:
+                # 别名列表：为每个别名创建映射
+                for alias in aliases:
                     self._alias_to_module[alias] = module_name
-        except Exception:
-            # 如果创建实例失败，跳过别名缓存
-            pass
 
     def mark_as_loaded(self, module_name: str) -> None:
         """标记模块为已加载。
@@ -48,6 +75,13 @@ class LazyModuleTracker:
         self._loaded_modules.add(module_name)
         if module_name in self._lazy_modules:
             del self._lazy_modules[module_name]
+        self._pending_alias_sources.pop(module_name, None)
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """已加载集合的版本号（单调递增）。"""
+        return self._version
 
     def is_loaded(self, module_name: str) -> bool:
         """检查模块是否已加载。
@@ -69,21 +103,38 @@ class LazyModuleTracker:
         Returns:
             模块名称，如果未找到则返回 None
         """
-        return self._alias_to_module.get(alias)
-
-    def get_module_class(self, module_name: str) -> type[CommandModule] | None:
-        """获取模块类（从懒加载列表）。
+        found = self._alias_to_module.get(alias)
+        if found is not None or not self._pending_alias_sources:
+            return found
+
+        # 未命中且还有挂起的延迟引用：逐个解析其别名，直到命中。
+        # 解析过的引用会从队列移除，最多只为每个模块导入一次
+        for module_name, ref in list(self._pending_alias_sources.items()):
+            del self._pending_alias_sources[module_name]
+            try:
+                module_cls = ref.resolve()
+            except Exception:
+                continue
+            self._register_aliases(module_name, module_cls)
+            found = self._alias_to_module.get(alias)
+            if found is not None:
+                return found
+
+        return None
+
+    def get_module_class(self, module_name: str) -> "ModuleClassRef | None":
+        """获取模块类或其延迟引用（从懒加载列表）。
 
         Args:
             module_name: 模块名称
 
         Returns:
-            模块类，如果不存在则返回 None
+            模块类引用，如果不存在则返回 None
         """
         return self._lazy_modules.get(module_name)
 
     @property
-    def lazy_modules(self) -> dict[str, type[CommandModule]]:
+    def lazy_modules(self) -> dict[str, "ModuleClassRef"]:
         """懒加载模块字典（只读）。"""
         return self._lazy_modules.copy()
 
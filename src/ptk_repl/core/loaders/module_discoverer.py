@@ -1,12 +1,20 @@
 """模块发现器。"""
 
+import json
+import os
+import tempfile
 from pathlib import Path
 
+# 跨启动的发现结果缓存文件（按 modules 目录签名校验有效性）
+_REGISTRY_CACHE_PATH = Path.home() / ".ptk_repl" / "registry" / "commands.json"
+
 
 class ModuleDiscoverer:
     """模块发现器实现。
 
-    负责从文件系统中发现可用的模块。
+    负责从文件系统中发现可用的模块。发现结果按目录 mtime 缓存，
+    避免 REPL 中 help/补全反复触发文件系统扫描；同时持久化到
+    ``~/.ptk_repl/registry/commands.json``，热启动时直接复用。
 
     Example:
         >>> discoverer = ModuleDiscoverer(Path("/path/to/modules"))
@@ -21,6 +29,9 @@ class ModuleDiscoverer:
             modules_path: 模块目录路径
         """
         self._modules_path = modules_path
+        self._cache: list[str] | None = None
+        self._cache_set: frozenset[str] = frozenset()
+        self._cache_mtime: float = 0.0
 
     def discover(self) -> list[str]:
         """发现所有可用模块。
@@ -32,15 +43,32 @@ class ModuleDiscoverer:
             >>> discoverer.discover()
             ["core", "database", "ssh"]
         """
-        if not self._modules_path.exists():
+        try:
+            st = self._modules_path.stat()
+        except OSError:
             return []
 
-        module_dirs = [
-            d.name
-            for d in self._modules_path.iterdir()
-            if d.is_dir() and not d.name.startswith("_")
-        ]
-        return sorted(module_dirs)
+        if self._cache is not None and st.st_mtime == self._cache_mtime:
+            return self._cache
+
+        # 目录签名：mtime + 条目数变化都会触发重新扫描
+        signature = [st.st_mtime_ns, st.st_size]
+        modules = self._read_disk_cache(signature)
+        if modules is None:
+            # os.scandir 复用目录读取时的 DirEntry 信息，省去逐项 stat
+            with os.scandir(self._modules_path) as entries:
+                module_dirs = [
+                    e.name
+                    for e in entries
+                    if e.is_dir(follow_symlinks=False) and not e.name.startswith("_")
+                ]
+            modules = sorted(module_dirs)
+            self._write_disk_cache(signature, modules)
+
+        self._cache = modules
+        self._cache_set = frozenset(modules)
+        self._cache_mtime = st.st_mtime
+        return self._cache
 
     def is_available(self, module_name: str) -> bool:
         """检查模块是否可用。
@@ -57,5 +85,45 @@ class ModuleDiscoverer:
             >>> discoverer.is_available("nonexistent")
             False
         """
-        module_path = self._modules_path / module_name
-        return module_path.exists() and module_path.is_dir()
+        self.discover()
+        return module_name in self._cache_set
+
+    def _read_disk_cache(self, signature: list[int]) -> list[str] | None:
+        """读取磁盘缓存（签名不匹配或文件损坏时返回 None）。"""
+        try:
+            with open(_REGISTRY_CACHE_PATH, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        modules = data.get("modules")
+        if (
+            data.get("path") == str(self._modules_path)
+            and data.get("signature") == signature
+            and isinstance(modules, list)
+        ):
+            # JSON 载荷不可信：逐项转为 str，返回类型才有保证
+            return [str(m) for m in modules]
+        return None
+
+    def _write_disk_cache(self, signature: list[int], modules: list[str]) -> None:
+        """原子写入磁盘缓存（写失败静默忽略，不影响发现结果）。"""
+        data = {
+            "path": str(self._modules_path),
+            "signature": signature,
+            "modules": modules,
+        }
+        try:
+            _REGISTRY_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=_REGISTRY_CACHE_PATH.parent, suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False)
+                os.replace(tmp_path, _REGISTRY_CACHE_PATH)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass
@@ -1,44 +1,115 @@
 """模块发现服务。"""
 
 import importlib
-import pkgutil
+import os
+import sys
+from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from ptk_repl.core.base import CommandModule
     from ptk_repl.core.loaders.lazy_module_tracker import LazyModuleTracker
     from ptk_repl.core.resolvers import IModuleNameResolver
 
 
+class LazyClassRef:
+    """模块类的延迟引用。
+
+    只记录点分路径和类名，首次 resolve() 时才真正导入模块。
+    可调用（与模块类的实例化语义一致），供 UnifiedModuleLoader
+    直接 ``module_cls()`` 使用。
+    """
+
+    __slots__ = ("_module_path", "_class_symbol", "_cls")
+
+    def __init__(self, module_path: str, class_symbol: str) -> None:
+        """初始化延迟引用。
+
+        Args:
+            module_path: 点分模块路径（如 "ptk_repl.modules.ssh"）
+            class_symbol: 模块类名（如 "SSHModule"）
+        """
+        self._module_path = module_path
+        self._class_symbol = class_symbol
+        self._cls: type[CommandModule] | None = None
+
+    def resolve(self) -> "type[CommandModule]":
+        """解析真实模块类（首次调用时导入）。
+
+        Returns:
+            模块类
+
+        Raises:
+            ImportError: 模块导入失败
+            AttributeError: 模块中不存在预期的类
+        """
+        if self._cls is None:
+            mod = sys.modules.get(self._module_path) or importlib.import_module(
+                self._module_path
+            )
+            self._cls = getattr(mod, self._class_symbol)
+        return self._cls
+
+    def __call__(self) -> "CommandModule":
+        """实例化模块（触发首次导入）。"""
+        return self.resolve()()
+
+
+# 懒加载登记的取值类型：真实模块类或其延迟引用
+type ModuleClassRef = type["CommandModule"] | LazyClassRef
+
+
 class ModuleDiscoveryService:
     """模块发现服务。
 
     负责从文件系统和 Python 包中发现可用模块。
     """
 
-    def __init__(self, modules_path: Path) -> None:
+    def __init__(
+        self,
+        modules_path: Path,
+        error_callback: Callable[[str], None] | None = None,
+    ) -> None:
         """初始化发现服务。
 
         Args:
             modules_path: 模块目录路径
+            error_callback: 错误回调（可选，默认静默）
         """
         self._modules_path = modules_path
+        self._error_callback = error_callback
+        # 发现结果缓存：目录 mtime_ns 不变时直接复用
+        self._cache: tuple[int, list[str]] | None = None
 
     def discover(self) -> list[str]:
-        """发现所有可用模块。
+        """发现所有可用模块（结果按目录 mtime 缓存）。
 
         Returns:
             模块名称列表（按字母顺序排序）
         """
-        if not self._modules_path.exists():
+        try:
+            mtime_ns = os.stat(self._modules_path).st_mtime_ns
+        except OSError:
+            return []
+
+        if self._cache is not None and self._cache[0] == mtime_ns:
+            return self._cache[1]
+
+        try:
+            # os.scandir 复用目录读取时的 DirEntry 信息，省去逐项 stat；
+            # sys.intern 让后续字典查找走指针比较快路径
+            with os.scandir(self._modules_path) as entries:
+                modules = sorted(
+                    sys.intern(e.name)
+                    for e in entries
+                    if not e.name.startswith("_") and e.is_dir(follow_symlinks=False)
+                )
+        except OSError:
             return []
 
-        module_dirs = [
-            d.name
-            for d in self._modules_path.iterdir()
-            if d.is_dir() and not d.name.startswith("_")
-        ]
-        return sorted(module_dirs)
+        self._cache = (mtime_ns, modules)
+        return modules
 
     def preload_all(
         self,
@@ -46,7 +117,7 @@ class ModuleDiscoveryService:
         name_resolver: "IModuleNameResolver",
         exclude: list[str] | None = None,
     ) -> None:
-        """预加载所有可用模块到追踪器。
+        """预登记所有可用模块到追踪器（仅元数据，不导入）。
 
         Args:
             tracker: 懒加载追踪器
@@ -56,47 +127,32 @@ class ModuleDiscoveryService:
         exclude = exclude or []
 
         try:
-            # 导入 modules 包
-            modules_package = importlib.import_module("ptk_repl.modules")
-
-            # 遍历所有模块
-            for _, module_name, _ in pkgutil.iter_modules(modules_package.__path__):
-                if module_name in exclude:
-                    continue
-
-                # 检查是否已经在追踪器中
-                if tracker.is_loaded(module_name):
-                    continue
-
-                # 预加载模块类
-                self._preload_module_class(module_name, tracker, name_resolver)
-
-        except Exception:
-            # 静默失败，模块加载时会再次尝试
-            pass
-
-    def _preload_module_class(
-        self,
-        module_name: str,
-        tracker: "LazyModuleTracker",
-        name_resolver: "IModuleNameResolver",
-    ) -> None:
-        """预加载模块类到追踪器。
-
-        Args:
-            module_name: 模块名称
-            tracker: 懒加载追踪器
-            name_resolver: 名称解析器
-        """
-        try:
-            module_path = f"ptk_repl.modules.{module_name}"
-            mod = importlib.import_module(module_path)
-
+            # 复用 discover() 的（缓存）扫描结果，避免再走一遍
+            # pkgutil/importer 机制；也无需导入 ptk_repl.modules 包
+            # （其 __init__ 为 PyInstaller 显式导入了所有模块类）
+            modules = self.discover()
+        except OSError as e:
+            # 预登记阶段已不再导入模块，只有目录扫描可能出错；
+            # 其他异常属于真实缺陷，应当正常抛出
+            if self._error_callback:
+                self._error_callback(f"模块发现失败: {e}")
+            return
+
+        for module_name in modules:
+            if module_name in exclude:
+                continue
+
+            # 检查是否已经在追踪器中
+            if tracker.is_loaded(module_name):
+                continue
+
+            # 只登记元数据（路径 + 类名），不导入模块本身；
+            # 真正的导入推迟到模块首次被使用
             class_name_prefix = name_resolver.resolve_class_name(module_name)
-            module_cls = getattr(mod, f"{class_name_prefix}Module")
-
-            tracker.add_lazy_module(module_name, module_cls)
-
-        except Exception:
-            # 静默失败，模块加载时会再次尝试
-            pass
+            tracker.add_lazy_module(
+                module_name,
+                LazyClassRef(
+                    f"ptk_repl.modules.{module_name}",
+                    f"{class_name_prefix}Module",
+                ),
+            )
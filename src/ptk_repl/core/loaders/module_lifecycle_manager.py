@@ -1,6 +1,6 @@
 """模块生命周期管理器。"""
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -15,6 +15,7 @@ from ptk_repl.core.resolvers import IModuleNameResolver
 if TYPE_CHECKING:
     from ptk_repl.core.completion.auto_completer import AutoCompleter
     from ptk_repl.core.interfaces import IModuleRegister
+    from ptk_repl.core.loaders.module_discovery_service import ModuleClassRef
 
 
 class ModuleLifecycleManager(IModuleLoader):
@@ -31,7 +32,7 @@ class ModuleLifecycleManager(IModuleLoader):
         module_register: "IModuleRegister",
         config: ConfigManager,
         auto_completer: "AutoCompleter",
-        register_commands_callback: Callable[[CommandModule], None],
+        register_commands_callback: Callable[["CommandModule"], None],
         error_callback: Callable[[str], None],
     ) -> None:
         """初始化生命周期管理器。
@@ -47,23 +48,25 @@ class ModuleLifecycleManager(IModuleLoader):
         """
         # 1. 初始化组件
         self._tracker = LazyModuleTracker()
-        self._discovery_service = ModuleDiscoveryService(modules_path)
+        self._discovery_service = ModuleDiscoveryService(
+            modules_path, error_callback=error_callback
+        )
         self._config = config
         self._auto_completer = auto_completer
         self._error_callback = error_callback
         self._name_resolver = name_resolver
 
         # 2. 创建加载器（注入回调）
-        post_load_callbacks = [
-            register_commands_callback,  # 注册命令
-            lambda m: auto_completer.refresh(),  # 刷新补全
-        ]
+        # 融合为单个回调：注册命令 + 刷新补全，每次加载只走一次调用开销
+        def _post_load(module: "CommandModule") -> None:
+            register_commands_callback(module)
+            auto_completer.refresh()
 
         self._loader = UnifiedModuleLoader(
             name_resolver=name_resolver,
             lazy_tracker=self._tracker,
             module_register=module_register,
-            post_load_callbacks=post_load_callbacks,
+            post_load_callbacks=[_post_load],
         )
 
     def load_modules(self) -> None:
@@ -74,7 +77,15 @@ class ModuleLifecycleManager(IModuleLoader):
         2. 预加载到懒加载追踪器
         3. 立即加载 core 模块
         4. 根据配置预加载其他模块
+
+        整个流程包在补全器的批量失效上下文中，
+        启动期间的 N 次补全刷新合并为一次。
         """
+        with self._auto_completer.batch_invalidate():
+            self._load_modules_inner()
+
+    def _load_modules_inner(self) -> None:
+        """加载流程主体（见 load_modules）。"""
         # 1. 自动发现并预加载所有模块（排除 core）
         self._discovery_service.preload_all(
             self._tracker,
@@ -87,11 +98,29 @@ class ModuleLifecycleManager(IModuleLoader):
 
         # 3. 从配置获取预加载列表
         preload_modules = self._config.get("core.preload_modules", [])
-
-        # 4. 预加载配置中的模块
-        for module_name in preload_modules:
-            if module_name != "core":
-                self.load_module_immediately(module_name)
+        preload_names = [n for n in preload_modules if n != "core"]
+
+        # 4. 并行预热导入（导入以 I/O 为主，GIL 在读盘/编译阶段释放）；
+        #    注册仍在主线程串行执行（注册表非线程安全）
+        if len(preload_names) > 1:
+            import importlib
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(8, len(preload_names))) as pool:
+                futures = [
+                    pool.submit(importlib.import_module, f"ptk_repl.modules.{name}")
+                    for name in preload_names
+                ]
+                for future in futures:
+                    try:
+                        future.result()
+                    except Exception:
+                        # 导入失败留给串行加载阶段报告
+                        pass
+
+        # 5. 串行加载（注册 + 回调）
+        for module_name in preload_names:
+            self.load_module_immediately(module_name)
 
     def load_module_immediately(self, module_name: str) -> None:
         """立即加载模块。
@@ -131,12 +160,16 @@ class ModuleLifecycleManager(IModuleLoader):
         """确保模块已加载（IModuleLoader 接口）。"""
         self._loader.ensure_module_loaded(module_name)
 
+    def find_by_alias(self, alias: str) -> str | None:
+        """通过别名查找懒加载模块名（IModuleLoader 接口）。"""
+        return self._loader.find_by_alias(alias)
+
     @property
-    def loaded_modules(self) -> dict[str, "CommandModule"]:
-        """已加载的模块字典（IModuleLoader 接口）。"""
+    def loaded_modules(self) -> Mapping[str, "CommandModule"]:
+        """已加载的模块映射（IModuleLoader 接口，只读视图）。"""
         return self._loader.loaded_modules
 
     @property
-    def lazy_modules(self) -> dict[str, type]:
+    def lazy_modules(self) -> dict[str, "ModuleClassRef"]:
         """懒加载模块字典（IModuleLoader 接口）。"""
         return self._loader.lazy_modules
@@ -40,7 +40,7 @@ class ModuleRegister:
         Returns:
             是否已注册
         """
-        return module_name in self._registry._modules
+        return self._registry.has_module(module_name)
 
     def get_module(self, module_name: str) -> "CommandModule | None":
         """获取已注册的模块实例。
@@ -71,6 +71,5 @@ class ModuleRegister:
 
         except Exception:
             # 清理：如果注册失败，从注册表中移除
-            if module.name in self._registry._modules:
-                del self._registry._modules[module.name]
+            self._registry.unregister_module(module.name)
             raise
@@ -1,7 +1,9 @@
 """统一模块加载器。"""
 
 import importlib
-from collections.abc import Callable
+import sys
+import types
+from collections.abc import Callable, Mapping
 from typing import TYPE_CHECKING
 
 from ptk_repl.core.interfaces import IModuleLoader, IModuleRegister
@@ -10,6 +12,7 @@ from ptk_repl.core.resolvers import IModuleNameResolver
 if TYPE_CHECKING:
     from ptk_repl.core.base import CommandModule
     from ptk_repl.core.loaders.lazy_module_tracker import LazyModuleTracker
+    from ptk_repl.core.loaders.module_discovery_service import ModuleClassRef
 
 
 class UnifiedModuleLoader(IModuleLoader):
@@ -24,7 +27,7 @@ class UnifiedModuleLoader(IModuleLoader):
         name_resolver: IModuleNameResolver,
         lazy_tracker: "LazyModuleTracker",
         module_register: IModuleRegister,
-        post_load_callbacks: list[Callable[[CommandModule], None]] | None = None,
+        post_load_callbacks: list[Callable[["CommandModule"], None]] | None = None,
     ) -> None:
         """初始化模块加载器。
 
@@ -38,6 +41,10 @@ class UnifiedModuleLoader(IModuleLoader):
         self._lazy_tracker = lazy_tracker
         self._module_register = module_register
         self._post_load_callbacks = post_load_callbacks or []
+        # 模块名 -> 类属性名（如 "ssh" -> "SSHModule"），重复加载时免拼接
+        self._attr_cache: dict[str, str] = {}
+        # (追踪器版本号, 只读视图) 缓存：无新模块加载时免重建字典
+        self._loaded_cache: tuple[int, Mapping[str, CommandModule]] | None = None
 
     def load(self, module_name: str) -> "CommandModule | None":
         """加载模块。
@@ -58,12 +65,16 @@ class UnifiedModuleLoader(IModuleLoader):
             module_cls = self._lazy_tracker.get_module_class(module_name)
 
             if not module_cls:
-                # 3. 动态导入模块
+                # 3. 动态导入模块（已导入时直接复用 sys.modules）
                 module_path = f"ptk_repl.modules.{module_name}"
-                mod = importlib.import_module(module_path)
+                mod = sys.modules.get(module_path) or importlib.import_module(module_path)
 
-                class_name_prefix = self._name_resolver.resolve_class_name(module_name)
-                module_cls = getattr(mod, f"{class_name_prefix}Module")
+                attr_name = self._attr_cache.get(module_name)
+                if attr_name is None:
+                    prefix = self._name_resolver.resolve_class_name(module_name)
+                    attr_name = f"{prefix}Module"
+                    self._attr_cache[module_name] = attr_name
+                module_cls = getattr(mod, attr_name)
 
             # 4. 创建模块实例
             module: CommandModule = module_cls()
@@ -97,23 +108,42 @@ class UnifiedModuleLoader(IModuleLoader):
     def ensure_module_loaded(self, module_name: str) -> None:
         """确保模块已加载（懒加载）。
 
+        直接委托给 load()：其已加载快路径即为所需检查，
+        避免在热路径上重复查询追踪器。
+
         Args:
             module_name: 模块名称
         """
-        if not self.is_loaded(module_name):
-            self.load(module_name)
+        self.load(module_name)
+
+    def find_by_alias(self, alias: str) -> str | None:
+        """通过别名查找懒加载模块名（IModuleLoader 接口）。
+
+        Args:
+            alias: 模块别名
+
+        Returns:
+            模块名称，如果未找到则返回 None
+        """
+        return self._lazy_tracker.find_by_alias(alias)
 
     @property
-    def loaded_modules(self) -> dict[str, "CommandModule"]:
-        """已加载的模块字典（只读）。"""
+    def loaded_modules(self) -> Mapping[str, "CommandModule"]:
+        """已加载的模块只读视图（按追踪器版本号缓存）。"""
+        version = self._lazy_tracker.version
+        if self._loaded_cache is not None and self._loaded_cache[0] == version:
+            return self._loaded_cache[1]
+
         result: dict[str, CommandModule] = {}
         for name in self._lazy_tracker.loaded_modules:
             module = self._module_register.get_module(name)
             if module:
                 result[name] = module
-        return result
+        view: Mapping[str, CommandModule] = types.MappingProxyType(result)
+        self._loaded_cache = (version, view)
+        return view
 
     @property
-    def lazy_modules(self) -> dict[str, type]:
+    def lazy_modules(self) -> dict[str, "ModuleClassRef"]:
         """懒加载模块字典（只读）。"""
         return self._lazy_tracker.lazy_modules
@@ -1,5 +1,7 @@
 """CLI 提示符管理器。"""
 
+from typing import ClassVar
+
 from ptk_repl.core.state.state_manager import StateManager
 
 
@@ -9,6 +11,14 @@ class PromptManager:
     负责根据当前状态动态生成提示符。
     """
 
+    # 模板分发表：(上下文已连接, 有主机) -> 预定义模板
+    _TEMPLATES: ClassVar[dict[tuple[bool, bool], str]] = {
+        (True, True): "(ptk:{suffix}) > ",
+        (True, False): "(ptk:{suffix}) > ",
+        (False, True): "(ptk:{host}:{port}) > ",
+    }
+    _DEFAULT_PROMPT: ClassVar[str] = "(ptk) > "
+
     def __init__(self, state_manager: StateManager) -> None:
         """初始化提示符管理器。
 
@@ -16,21 +26,37 @@ class PromptManager:
             state_manager: 状态管理器
         """
         self.state_manager = state_manager
+        # (状态版本号, 提示符) 缓存：状态未变时跳过重新拼接
+        self._cached: tuple[int, str] | None = None
 
     def get_prompt(self) -> str:
-        """动态生成提示符。
+        """动态生成提示符（按全局状态版本号缓存）。
 
         Returns:
             提示符字符串
         """
         gs = self.state_manager.global_state
-        if gs.connected:
-            ctx = gs.get_connection_context()
-            if ctx and ctx.is_connected():
-                # 使用多态方法，无需 isinstance 检查
-                suffix = ctx.get_prompt_suffix()
-                return f"(ptk:{suffix}) > "
-            elif gs.current_host:
-                # 兼容旧版本：显示主机和端口
-                return f"(ptk:{gs.current_host}:{gs.current_port}) > "
-        return "(ptk) > "
+        version = gs.version
+        if self._cached is not None and self._cached[0] == version:
+            return self._cached[1]
+
+        prompt = self._build_prompt()
+        self._cached = (version, prompt)
+        return prompt
+
+    def _build_prompt(self) -> str:
+        """根据当前状态生成提示符（查表分发，避免分支树）。"""
+        gs = self.state_manager.global_state
+        if not gs.connected:
+            return self._DEFAULT_PROMPT
+
+        ctx = gs.get_connection_context()
+        ctx_connected = bool(ctx and ctx.is_connected())
+        template = self._TEMPLATES.get((ctx_connected, bool(gs.current_host)))
+        if template is None:
+            return self._DEFAULT_PROMPT
+        if ctx_connected:
+            # 使用多态方法，无需 isinstance 检查
+            return template.format(suffix=ctx.get_prompt_suffix())  # type: ignore[union-attr]
+        # 兼容旧版本：显示主机和端口
+        return template.format(host=gs.current_host, port=gs.current_port)
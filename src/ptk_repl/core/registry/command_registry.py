@@ -1,15 +1,17 @@
 """命令注册表。"""
 
-from collections.abc import Callable
+import bisect
+import types
+from collections.abc import Callable, Mapping
 from typing import TYPE_CHECKING
 
+from ptk_repl.core.interfaces.registry import CommandInfo
+
 if TYPE_CHECKING:
     from ptk_repl.core.base import CommandModule
     from ptk_repl.core.completion.auto_completer import AutoCompleter
 
-
-# 命令信息类型：(模块名, 命令名, 处理函数)
-CommandInfo = tuple[str, str, Callable]
+__all__ = ["CommandInfo", "CommandRegistry"]
 
 
 class CommandRegistry:
@@ -23,7 +25,23 @@ class CommandRegistry:
         self._modules: dict[str, CommandModule] = {}
         self._command_map: dict[str, CommandInfo] = {}
         self._alias_map: dict[str, str] = {}
+        # 底层字典的只读视图（一次创建，随源字典实时更新）
+        self._command_map_view = types.MappingProxyType(self._command_map)
+        self._alias_map_view = types.MappingProxyType(self._alias_map)
+        # 反向别名索引 {完整命令: [别名, ...]}，随 _alias_map 增量维护
+        self._command_to_aliases: dict[str, list[str]] = {}
+        # 模块别名倒排索引与有序模块名列表（注册时增量维护），
+        # 让 _resolve_module_name 的别名查找 O(1)、前缀查找 O(log n)
+        self._module_alias_index: dict[str, str] = {}
+        self._sorted_module_names: list[str] = []
+        # 按模块分组的命令索引 {模块名: [命令名, ...]}，注册时增量维护
+        self._by_module: dict[str, list[str]] = {}
         self._completer: AutoCompleter | None = None
+        # 注册版本号：每次注册模块/命令 +1，用于失效排序缓存
+        self._version = 0
+        self._sorted_cache_version = -1
+        self._sorted_modules: list[CommandModule] = []
+        self._sorted_commands: dict[str, list[str]] = {}
 
     def set_completer(self, completer: "AutoCompleter") -> None:
         """设置补全器。
@@ -45,6 +63,18 @@ class CommandRegistry:
         if module.name in self._modules:
             raise ValueError(f"模块 '{module.name}' 已存在")
         self._modules[module.name] = module
+        self._index_module(module)
+        self._version += 1
+
+    def _index_module(self, module: "CommandModule") -> None:
+        """维护模块名/别名索引（注册时调用一次，查找时免扫描）。"""
+        bisect.insort(self._sorted_module_names, module.name)
+        aliases = getattr(module, "aliases", None)
+        if isinstance(aliases, str):
+            self._module_alias_index[aliases] = module.name
+        elif aliases:
+            for alias in aliases:
+                self._module_alias_index[alias] = module.name
 
     def register_command(
         self,
@@ -70,11 +100,14 @@ class CommandRegistry:
             raise ValueError(f"命令 '{full_command}' 已存在")
 
         self._command_map[full_command] = (module_name, command_name, handler)
+        self._by_module.setdefault(module_name, []).append(command_name)
+        self._version += 1
 
-        # 注册别名
+        # 注册别名（同时维护反向索引）
         if aliases:
             for alias in aliases:
                 self._alias_map[alias] = full_command
+                self._command_to_aliases.setdefault(full_command, []).append(alias)
 
         # 自动通知补全器更新
         if self._completer:
@@ -124,18 +157,62 @@ class CommandRegistry:
             # 返回模块的真实名称（不是别名）
             return module.name if hasattr(module, "name") else short_name
 
-        # 2. 遍历所有模块，检查别名（动态读取）
-        for module in self._modules.values():
-            if hasattr(module, "aliases") and module.aliases == short_name:
-                return module.name
+        # 2. 别名倒排索引（注册时建好，O(1) 查找）
+        alias_hit = self._module_alias_index.get(short_name)
+        if alias_hit is not None:
+            return alias_hit
 
-        # 3. 前缀匹配（保留现有能力）
-        for module_name in self._modules:
-            if module_name.startswith(short_name):
-                return module_name
+        # 3. 前缀匹配（有序列表上二分，保留现有能力）
+        i = bisect.bisect_left(self._sorted_module_names, short_name)
+        if i < len(self._sorted_module_names) and self._sorted_module_names[i].startswith(
+            short_name
+        ):
+            return self._sorted_module_names[i]
 
         return None
 
+    def get_aliases_for(self, command: str) -> list[str]:
+        """获取命令的所有别名。
+
+        Args:
+            command: 完整命令（如 "database connect" 或 "help"）
+
+        Returns:
+            别名列表的副本，没有别名时返回空列表
+
+        Examples:
+            >>> registry.get_aliases_for("help")
+            ["h"]
+        """
+        aliases = self._command_to_aliases.get(command)
+        return list(aliases) if aliases else []
+
+    def has_module(self, name: str) -> bool:
+        """检查模块是否已注册。
+
+        Args:
+            name: 模块名称
+
+        Returns:
+            是否已注册
+        """
+        return name in self._modules
+
+    def unregister_module(self, name: str) -> None:
+        """移除已注册的模块（不存在时静默忽略）。
+
+        Args:
+            name: 模块名称
+        """
+        if self._modules.pop(name, None) is not None:
+            i = bisect.bisect_left(self._sorted_module_names, name)
+            if i < len(self._sorted_module_names) and self._sorted_module_names[i] == name:
+                del self._sorted_module_names[i]
+            self._module_alias_index = {
+                alias: mod for alias, mod in self._module_alias_index.items() if mod != name
+            }
+            self._version += 1
+
     def get_module(self, name: str) -> "CommandModule | None":
         """获取模块。
 
@@ -156,11 +233,23 @@ class CommandRegistry:
         Returns:
             命令列表
         """
-        result: list[str] = []
-        for _full_cmd, (mod_name, cmd_name, _) in self._command_map.items():
-            if mod_name == module_name:
-                result.append(cmd_name)
-        return result
+        return list(self._by_module.get(module_name, ()))
+
+    def list_module_commands_sorted(self, module_name: str) -> list[str]:
+        """列出模块的所有命令（按字母顺序，结果缓存至下次注册）。
+
+        Args:
+            module_name: 模块名称
+
+        Returns:
+            排序后的命令列表
+        """
+        self._refresh_sorted_caches()
+        cached = self._sorted_commands.get(module_name)
+        if cached is None:
+            cached = sorted(self.list_module_commands(module_name))
+            self._sorted_commands[module_name] = cached
+        return cached
 
     def list_modules(self) -> list["CommandModule"]:
         """列出所有模块。
@@ -170,40 +259,58 @@ class CommandRegistry:
         """
         return list(self._modules.values())
 
-    def get_all_commands(self) -> dict[str, CommandInfo]:
-        """获取所有命令的副本（避免直接访问私有成员）。
+    def list_modules_sorted(self) -> list["CommandModule"]:
+        """列出所有模块（按模块名排序，结果缓存至下次注册）。
+
+        Returns:
+            排序后的模块列表
+        """
+        self._refresh_sorted_caches()
+        return self._sorted_modules
+
+    def _refresh_sorted_caches(self) -> None:
+        """注册版本号变化时重建排序缓存。"""
+        if self._sorted_cache_version != self._version:
+            self._sorted_modules = sorted(self._modules.values(), key=lambda m: m.name)
+            self._sorted_commands.clear()
+            self._sorted_cache_version = self._version
+
+    def get_all_commands(self) -> Mapping[str, CommandInfo]:
+        """获取所有命令的只读视图（零拷贝）。
 
         Returns:
-            命令字典的副本 {full_command: (module_name, command_name, handler)}
+            命令字典的 MappingProxyType 视图，随注册实时更新
+            {full_command: (module_name, command_name, handler)}
             - full_command: 完整命令（如 "database connect" 或 "help"）
             - module_name: 模块名称
             - command_name: 命令名称
             - handler: 命令处理函数
 
         Note:
-            返回的是副本，修改返回值不会影响原始注册表。
+            只读视图，请勿修改；需要隔离副本时请自行 dict(...) 拷贝。
 
         Examples:
             >>> commands = registry.get_all_commands()
             >>> "help" in commands
             True
         """
-        return self._command_map.copy()
+        return self._command_map_view
 
-    def get_all_aliases(self) -> dict[str, str]:
-        """获取所有别名的副本（避免直接访问私有成员）。
+    def get_all_aliases(self) -> Mapping[str, str]:
+        """获取所有别名的只读视图（零拷贝）。
 
         Returns:
-            别名字典的副本 {alias: full_command}
+            别名字典的 MappingProxyType 视图，随注册实时更新
+            {alias: full_command}
             - alias: 别名（如 "h"）
             - full_command: 对应的完整命令（如 "help"）
 
         Note:
-            返回的是副本，修改返回值不会影响原始注册表。
+            只读视图，请勿修改；需要隔离副本时请自行 dict(...) 拷贝。
 
         Examples:
             >>> aliases = registry.get_all_aliases()
             >>> aliases["h"]
             "help"
         """
-        return self._alias_map.copy()
+        return self._alias_map_view
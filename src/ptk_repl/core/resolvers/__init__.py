@@ -4,6 +4,7 @@
 """
 
 from ptk_repl.core.resolvers.module_name_resolver import (
+    DEFAULT_RESOLVER,
     ConfigurableResolver,
     DefaultModuleNameResolver,
     IModuleNameResolver,
@@ -13,4 +14,5 @@ __all__ = [
     "IModuleNameResolver",
     "DefaultModuleNameResolver",
     "ConfigurableResolver",
+    "DEFAULT_RESOLVER",
 ]
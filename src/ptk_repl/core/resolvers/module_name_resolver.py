@@ -3,7 +3,8 @@
 提供可扩展的模块名称到类名的解析策略，遵循开闭原则。
 """
 
-from typing import Protocol, runtime_checkable
+from functools import lru_cache
+from typing import Final, Protocol, runtime_checkable
 
 
 @runtime_checkable
@@ -45,6 +46,12 @@ class IModuleNameResolver(Protocol):
         ...
 
 
+@lru_cache(maxsize=128)
+def _capitalize(module_name: str) -> str:
+    """首字母大写（模块级缓存，不随解析器实例存活）。"""
+    return module_name.capitalize()
+
+
 class DefaultModuleNameResolver:
     """默认模块名称解析器。
 
@@ -69,7 +76,7 @@ class DefaultModuleNameResolver:
             >>> resolver.resolve_class_name("ssh")
             'Ssh'
         """
-        return module_name.capitalize()
+        return _capitalize(module_name)
 
 
 class ConfigurableResolver:
@@ -93,6 +100,9 @@ class ConfigurableResolver:
                     例如: {"ssh": "SSH", "api": "API"}
         """
         self._mapping = mapping or {"ssh": "SSH", "api": "API"}
+        # 解析缓存：配置映射作为种子，capitalize 回退结果按需补入，
+        # 命中路径收敛为一次字典取值
+        self._cache: dict[str, str] = dict(self._mapping)
 
     def resolve_class_name(self, module_name: str) -> str:
         """使用配置映射或默认规则。
@@ -103,4 +113,13 @@ class ConfigurableResolver:
         Returns:
             类名前缀（优先使用配置，否则使用默认规则）
         """
-        return self._mapping.get(module_name, module_name.capitalize())
+        try:
+            return self._cache[module_name]
+        except KeyError:
+            resolved = module_name.capitalize()
+            self._cache[module_name] = resolved
+            return resolved
+
+
+# 共享单例：解析器无状态（缓存在模块级 _capitalize 上），复用同一实例
+DEFAULT_RESOLVER: Final[IModuleNameResolver] = DefaultModuleNameResolver()
@@ -18,6 +18,8 @@ class StateManager:
         """初始化状态管理器。"""
         self._global_state = GlobalState()
         self._module_states: dict[str, ModuleState] = {}
+        # 已通过类型检查的 (模块名, 状态类) 组合
+        self._validated: set[tuple[str, type]] = set()
 
     @property
     def global_state(self) -> GlobalState:
@@ -34,18 +36,24 @@ class StateManager:
         Returns:
             模块状态实例
         """
-        if module_name not in self._module_states:
-            self._module_states[module_name] = state_cls()
-
-        state = self._module_states[module_name]
-
-        if not isinstance(state, state_cls):
-            raise TypeError(
-                f"模块 '{module_name}' 状态类型不匹配: "
-                f"期望 {state_cls.__name__}, 实际 {type(state).__name__}"
-            )
-
-        return state
+        # EAFP：命中路径单次取值，未命中才构造（每模块只发生一次）
+        try:
+            state = self._module_states[module_name]
+        except KeyError:
+            state = self._module_states[module_name] = state_cls()
+
+        # isinstance 只在每个 (模块, 状态类) 组合首次调用时检查一次，
+        # 命中路径收敛为一次字典取值 + 一次集合成员判断
+        key = (module_name, state_cls)
+        if key not in self._validated:
+            if not isinstance(state, state_cls):
+                raise TypeError(
+                    f"模块 '{module_name}' 状态类型不匹配: "
+                    f"期望 {state_cls.__name__}, 实际 {type(state).__name__}"
+                )
+            self._validated.add(key)
+
+        return state  # type: ignore[return-value]
 
     def reset_module_state(self, module_name: str) -> None:
         """重置模块状态。
@@ -59,5 +67,6 @@ class StateManager:
     def reset_all(self) -> None:
         """重置所有状态（全局和模块）。"""
         self._global_state.reset()
-        for state in self._module_states.values():
+        # 先物化为元组：reset 可能间接增删模块状态，避免字典视图在迭代中失效
+        for state in tuple(self._module_states.values()):
             state.reset()
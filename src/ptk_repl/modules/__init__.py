@@ -1,9 +1,32 @@
 """命令模块。"""
 
-# 显式导入所有可用模块（用于 PyInstaller 打包）
-# 这些导入确保 PyInstaller 能发现所有模块
-from ptk_repl.modules.core.module import CoreModule
-from ptk_repl.modules.database.module import DatabaseModule
-from ptk_repl.modules.ssh.module import SSHModule
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ptk_repl.modules.core.module import CoreModule
+    from ptk_repl.modules.database.module import DatabaseModule
+    from ptk_repl.modules.ssh.module import SSHModule
 
 __all__ = ["CoreModule", "DatabaseModule", "SSHModule"]
+
+# PEP 562 惰性属性加载：首次引用时才编译对应模块，
+# 避免解释器启动就拉起 pydantic/paramiko 等重量级依赖。
+# PyInstaller 打包时由 build 脚本的 hiddenimports 负责收集。
+_LAZY_MODULES = {
+    "CoreModule": "ptk_repl.modules.core.module",
+    "DatabaseModule": "ptk_repl.modules.database.module",
+    "SSHModule": "ptk_repl.modules.ssh.module",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """按需导入模块类（PEP 562）。"""
+    module_path = _LAZY_MODULES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    obj = getattr(importlib.import_module(module_path), name)
+    # 写回 globals，后续访问不再进入 __getattr__
+    globals()[name] = obj
+    return obj
@@ -1,6 +1,8 @@
 """核心命令模块。"""
 
-from typing import TYPE_CHECKING
+from collections.abc import Callable
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
 from ptk_repl.core.base import CommandModule
 from ptk_repl.core.formatting.help_formatter import HelpFormatter
@@ -9,6 +11,97 @@ if TYPE_CHECKING:
     from ptk_repl.cli import PromptToolkitCLI
 
 
+# 命令实现提升到模块级：每次 register_commands 复用同一批代码对象，
+# cli 等依赖通过 partial 作为普通参数绑定（LOAD_FAST 而非 LOAD_DEREF）
+
+
+def _status(cli: "PromptToolkitCLI", args: str) -> None:
+    """显示当前状态。"""
+    state = cli.state.global_state
+    if state.connected:
+        cli.poutput(f"已连接到 {state.current_host}:{state.current_port}")
+    else:
+        cli.poutput("未连接")
+
+
+def _do_exit(cli: "PromptToolkitCLI", args: str) -> None:
+    """退出 REPL。"""
+    cli.poutput("再见!")
+    raise EOFError
+
+
+def _do_quit(cli: "PromptToolkitCLI", args: str) -> None:
+    """退出 REPL（exit 的别名）。"""
+    cli.poutput("再见!")
+    raise EOFError
+
+
+def _modules(cli: "PromptToolkitCLI", args: str) -> None:
+    """列出所有已加载的模块。"""
+    cli.poutput("已加载的模块:")
+    for module in cli.registry.list_modules():
+        version = module.version
+        description = module.description or "无描述"
+        cli.poutput(f"  • {module.name} (v{version}): {description}")
+
+    # 显示待加载的模块
+    lazy_modules = cli._module_manager.lazy_modules
+    if lazy_modules:
+        cli.poutput("\n待加载（延迟）:")
+        for module_name in lazy_modules:
+            cli.poutput(f"  • {module_name} (首次使用时加载)")
+
+
+def _do_help(cli: "PromptToolkitCLI", help_formatter: HelpFormatter, args: str) -> None:
+    """显示帮助信息。
+
+    支持以下用法：
+    - help              显示总览帮助
+    - help <command>    显示命令详细帮助
+    - help <module>     显示模块所有命令
+    """
+    # strip 结果只算一次，后续复用同一局部变量
+    stripped = args.strip()
+
+    # 如果没有参数，显示总览帮助
+    if not stripped:
+        cli.poutput(help_formatter.format_overview_help())
+        return
+
+    # 解析参数
+    parts = stripped.split()
+
+    # 尝试解析为命令
+    cmd_info = cli.registry.get_command_info(stripped)
+
+    if cmd_info:
+        # 是一个完整命令
+        module_name, command_name, _ = cmd_info
+        cli.poutput(help_formatter.format_command_help(module_name, command_name))
+        return
+
+    # 尝试解析为模块
+    if len(parts) == 1:
+        module = cli.registry.get_module(parts[0])
+        if module:
+            cli.poutput(help_formatter.format_module_help(parts[0]))
+            return
+
+    # 未找到
+    cli.poutput(f"未找到命令或模块: {stripped}")
+    cli.poutput("\n提示:")
+    cli.poutput("  • 使用 'help' 查看总览帮助")
+    cli.poutput("  • 使用 'help <command>' 查看命令帮助")
+    cli.poutput("  • 使用 'help <module>' 查看模块帮助")
+
+
+def _bind(func: Callable[..., None], *bound: Any) -> Callable[[str], None]:
+    """绑定依赖并保留原函数引用（供 help/补全提取 docstring）。"""
+    handler = partial(func, *bound)
+    handler._original_func = func  # type: ignore[attr-defined]
+    return handler
+
+
 class CoreModule(CommandModule):
     """核心命令模块。"""
 
@@ -22,10 +115,7 @@ class CoreModule(CommandModule):
         """模块描述。"""
         return "核心命令（状态、帮助、退出等）"
 
-    @property
-    def aliases(self) -> str | None:
-        """模块短别名。"""
-        return None  # 核心模块不需要别名
+    # 核心模块不需要别名，直接使用基类默认值 None
 
     def register_commands(self, cli: "PromptToolkitCLI") -> None:
         """注册核心命令。
@@ -36,80 +126,9 @@ class CoreModule(CommandModule):
         # 创建帮助格式化器
         help_formatter = HelpFormatter(cli)
 
-        # 使用装饰器注册命令（更优雅的方式）
-        @cli.command()
-        def status(args: str) -> None:
-            """显示当前状态。"""
-            state = cli.state.global_state
-            if state.connected:
-                cli.poutput(f"已连接到 {state.current_host}:{state.current_port}")
-            else:
-                cli.poutput("未连接")
-
-        @cli.command(name="exit")
-        def do_exit(args: str) -> None:
-            """退出 REPL。"""
-            cli.poutput("再见!")
-            raise EOFError
-
-        @cli.command(name="quit")
-        def do_quit(args: str) -> None:
-            """退出 REPL（exit 的别名）。"""
-            cli.poutput("再见!")
-            raise EOFError
-
-        @cli.command()
-        def modules(args: str) -> None:
-            """列出所有已加载的模块。"""
-            cli.poutput("已加载的模块:")
-            for module in cli.registry.list_modules():
-                version = module.version
-                description = module.description or "无描述"
-                cli.poutput(f"  • {module.name} (v{version}): {description}")
-
-            # 显示待加载的模块
-            lazy_modules = cli._module_manager.lazy_modules
-            if lazy_modules:
-                cli.poutput("\n待加载（延迟）:")
-                for module_name in lazy_modules:
-                    cli.poutput(f"  • {module_name} (首次使用时加载)")
-
-        @cli.command(name="help")
-        def do_help(args: str) -> None:
-            """显示帮助信息。
-
-            支持以下用法：
-            - help              显示总览帮助
-            - help <command>    显示命令详细帮助
-            - help <module>     显示模块所有命令
-            """
-            # 如果没有参数，显示总览帮助
-            if not args.strip():
-                cli.poutput(help_formatter.format_overview_help())
-                return
-
-            # 解析参数
-            parts = args.strip().split()
-
-            # 尝试解析为命令
-            cmd_info = cli.registry.get_command_info(args.strip())
-
-            if cmd_info:
-                # 是一个完整命令
-                module_name, command_name, _ = cmd_info
-                cli.poutput(help_formatter.format_command_help(module_name, command_name))
-                return
-
-            # 尝试解析为模块
-            if len(parts) == 1:
-                module = cli.registry.get_module(parts[0])
-                if module:
-                    cli.poutput(help_formatter.format_module_help(parts[0]))
-                    return
-
-            # 未找到
-            cli.poutput(f"未找到命令或模块: {args.strip()}")
-            cli.poutput("\n提示:")
-            cli.poutput("  • 使用 'help' 查看总览帮助")
-            cli.poutput("  • 使用 'help <command>' 查看命令帮助")
-            cli.poutput("  • 使用 'help <module>' 查看模块帮助")
+        # 注册模块级命令实现（partial 绑定依赖，函数对象跨实例共享）
+        cli.command(name="status")(_bind(_status, cli))
+        cli.command(name="exit")(_bind(_do_exit, cli))
+        cli.command(name="quit")(_bind(_do_quit, cli))
+        cli.command(name="modules")(_bind(_modules, cli))
+        cli.command(name="help")(_bind(_do_help, cli, help_formatter))
@@ -38,10 +38,8 @@ class DatabaseModule(CommandModule):
         """模块描述。"""
         return "数据库操作（连接、查询、断开）"
 
-    @property
-    def aliases(self) -> str | None:
-        """模块短别名。"""
-        return "db"
+    # 模块短别名（类属性，支持免实例化读取）
+    aliases: str | None = "db"
 
     def initialize(self, state_manager: "StateManager") -> None:
         """模块初始化。
@@ -1,19 +1,31 @@
 """数据库模块状态。"""
 
+from collections import deque
+from typing import Any, ClassVar
+
 from pydantic import Field
 
 from ptk_repl.state.module_state import ModuleState
 
+# 查询历史上限：有界缓冲，长会话下内存不随查询数无限增长
+_HISTORY_MAXLEN = 1000
+
 
 class DatabaseState(ModuleState):
     """数据库模块状态。"""
 
     active_database: str | None = None
     connection_pool_size: int = 10
-    query_history: list[str] = Field(default_factory=list)
+    query_history: deque[str] = Field(default_factory=lambda: deque(maxlen=_HISTORY_MAXLEN))
+
+    # 重置原型：默认值在类定义时固定，reset 直接写回 __dict__，
+    # 跳过三次 pydantic setattr 校验
+    _RESET_DEFAULTS: ClassVar[dict[str, Any]] = {
+        "active_database": None,
+        "connection_pool_size": 10,
+    }
 
     def reset(self) -> None:
-        """重置数据库状态。"""
-        self.active_database = None
-        self.connection_pool_size = 10
+        """重置数据库状态（绕过逐字段校验）。"""
+        self.__dict__.update(self._RESET_DEFAULTS)
         self.query_history.clear()
@@ -1,9 +1,10 @@
 """SSH 配置模型。"""
 
-from collections.abc import Callable
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, Literal
+from weakref import WeakKeyDictionary
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 if TYPE_CHECKING:
     from ptk_repl.core.configuration.config_manager import ConfigManager
@@ -63,9 +64,41 @@ class SSHModuleConfig(BaseModel):
     environments: list[SSHEnvironment] = Field(default_factory=list)
     log_paths: dict[str, list[LogConfig]] = Field(default_factory=dict)
 
+    @cached_property
+    def env_by_name(self) -> dict[str, SSHEnvironment]:
+        """环境名到环境配置的索引（首次访问时构建一次）。"""
+        return {e.name: e for e in self.environments}
+
+    @cached_property
+    def env_choice_bases(self) -> list[tuple[str, str]]:
+        """环境选择对话框的静态显示部分：(环境名, " 名称 - 描述")。
+
+        名称和描述在运行期不变，格式化一次即可；
+        对话框每次调用只需拼接动态的连接状态前缀。
+        """
+        return [(e.name, f" {e.name} - {e.description}") for e in self.environments]
+
+
+# 批量校验适配器（导入时编译一次）：整表一次 C 层校验，
+# 比逐条 Model(**cfg) 构造省去重复的校验器初始化
+_ENV_LIST_ADAPTER: TypeAdapter[list[SSHEnvironment]] = TypeAdapter(list[SSHEnvironment])
+_LOG_ADAPTERS: dict[str, TypeAdapter[Any]] = {
+    "direct": TypeAdapter(list[DirectLogConfig]),
+    "k8s": TypeAdapter(list[K8sLogConfig]),
+    "docker": TypeAdapter(list[DockerLogConfig]),
+}
+
+
+# 解析结果缓存：按配置管理器实例弱引用缓存，
+# 管理器被回收时条目自动清理；配置在运行期不可变，无需失效逻辑
+_CONFIG_CACHE: "WeakKeyDictionary[Any, SSHModuleConfig]" = WeakKeyDictionary()
+
 
 def load_ssh_config(config_manager: "ConfigManager | Any") -> SSHModuleConfig:
-    """从配置管理器加载 SSH 配置。
+    """从配置管理器加载 SSH 配置（按管理器实例缓存）。
+
+    每次 ssh connect/status/日志查看都会调用；pydantic 校验是
+    这里的主要开销，同一管理器只解析一次。
 
     Args:
         config_manager: 配置管理器实例
@@ -73,27 +106,36 @@ def load_ssh_config(config_manager: "ConfigManager | Any") -> SSHModuleConfig:
     Returns:
         SSH 模块配置
     """
+    cached = _CONFIG_CACHE.get(config_manager)
+    if cached is not None:
+        return cached
+
+    config = _parse_ssh_config(config_manager)
+    try:
+        _CONFIG_CACHE[config_manager] = config
+    except TypeError:
+        # 不可弱引用的管理器（测试替身等）：跳过缓存
+        pass
+    return config
+
+
+def _parse_ssh_config(config_manager: "ConfigManager | Any") -> SSHModuleConfig:
+    """实际的解析逻辑（见 load_ssh_config）。"""
     ssh_config_dict = config_manager.get("modules.ssh", {})
 
     if not ssh_config_dict:
         return SSHModuleConfig()
 
-    # 解析环境列表
-    environments = [SSHEnvironment(**env) for env in ssh_config_dict.get("environments", [])]
-
-    # 日志配置解析器映射
-    log_parsers: dict[str, Callable[[list[dict[str, Any]]], list[LogConfig]]] = {
-        "direct": lambda cfgs: [DirectLogConfig(**cfg) for cfg in cfgs],
-        "k8s": lambda cfgs: [K8sLogConfig(**cfg) for cfg in cfgs],
-        "docker": lambda cfgs: [DockerLogConfig(**cfg) for cfg in cfgs],
-    }
+    # 解析环境列表（整表一次批量校验）
+    environments = _ENV_LIST_ADAPTER.validate_python(ssh_config_dict.get("environments", []))
 
-    # 解析全局日志配置
+    # 解析全局日志配置（按模式查预编译适配器分发）
     log_paths: dict[str, list[LogConfig]] = {}
     raw_log_paths = ssh_config_dict.get("log_paths", {})
 
     for mode, configs in raw_log_paths.items():
-        if mode in log_parsers:
-            log_paths[mode] = log_parsers[mode](configs)
+        adapter = _LOG_ADAPTERS.get(mode)
+        if adapter:
+            log_paths[mode] = adapter.validate_python(configs)
 
     return SSHModuleConfig(environments=environments, log_paths=log_paths)
@@ -38,15 +38,11 @@ class SSHConnectionManager:
         """
         config = load_ssh_config(self.cli.config)
 
-        # 查找环境配置
-        env_config = None
-        for env in config.environments:
-            if env.name == env_name:
-                env_config = env
-                break
+        # 查找环境配置（O(1) 索引查找）
+        env_config = config.env_by_name.get(env_name)
 
         if not env_config:
-            available = [e.name for e in config.environments]
+            available = config.env_by_name.keys()
             self.cli.perror(f"环境 '{env_name}' 不存在。可用环境: {', '.join(available)}")
             return False
 
@@ -1,16 +1,38 @@
 """交互式对话框 - 使用 questionary 实现。"""
 
 import re
-from typing import TYPE_CHECKING, cast
+from functools import lru_cache
+from typing import TYPE_CHECKING, Final, cast
 
-import questionary
-from questionary import Choice
+# questionary 在各对话框函数内延迟导入：
+# 它会拉起完整的 prompt_toolkit 栈，不该出现在模块导入路径上
 
 if TYPE_CHECKING:
     from ptk_repl.modules.ssh.config import LogConfig, SSHModuleConfig
     from ptk_repl.modules.ssh.state import SSHState
     from ptk_repl.state.global_state import GlobalState
 
+# 环境连接状态图标（按状态键查表，免去每次调用的分支链）
+_STATUS = {
+    "current": "🟢 [当前]",
+    "connected": "🔵 [已连接]",
+    "idle": "⚪ [未连接]",
+}
+
+# 日志模式显示名（模块级常量，不在每次对话框调用里重建）
+_MODE_NAMES: Final[dict[str, str]] = {
+    "direct": "直接日志",
+    "k8s": "Kubernetes 容器日志",
+    "docker": "Docker 容器日志",
+}
+
+# 各日志类型的显示属性及其格式：单次查表替代 if/elif 分支链
+_DISPLAY_ATTR: Final[dict[str, tuple[str, str]]] = {
+    "direct": ("path", "{}"),
+    "docker": ("container_name", "容器: {}"),
+    "k8s": ("pod", "Pod: {}"),
+}
+
 
 def select_environment_dialog(
     config: "SSHModuleConfig", state: "SSHState", global_state: "GlobalState"
@@ -28,33 +50,33 @@ def select_environment_dialog(
     if not config or not config.environments:
         return None
 
+    import questionary
+    from questionary import Choice
+
     # 获取当前环境
     from ptk_repl.state.connection_context import SSHConnectionContext
 
     ctx = global_state.get_connection_context()
     current_env = ctx.current_env if isinstance(ctx, SSHConnectionContext) else None
 
-    # 构建选项列表（包含连接状态）
+    # 构建选项列表：静态部分（名称/描述）取自配置上的预格式化缓存，
+    # 每次调用只拼接动态的状态图标
+    active = state.active_environments
     choices = []
-    for env in config.environments:
-        is_connected = env.name in state.active_environments
-        is_current = current_env == env.name
-
-        # 状态图标
-        if is_current:
-            status = "🟢 [当前]"
-        elif is_connected:
-            status = "🔵 [已连接]"
-        else:
-            status = "⚪ [未连接]"
-
-        display_text = f"{status} {env.name} - {env.description}"
+    for env_name, base_text in config.env_choice_bases:
+        key = (
+            "current"
+            if current_env == env_name
+            else "connected"
+            if env_name in active
+            else "idle"
+        )
 
         # 使用 Choice 对象，value 为环境名
         choices.append(
             Choice(
-                title=display_text,
-                value=env.name,
+                title=_STATUS[key] + base_text,
+                value=env_name,
             )
         )
 
@@ -84,31 +106,21 @@ def select_log_dialog(log_configs: list["LogConfig"], mode: str) -> "LogConfig |
     if not log_configs:
         return None
 
-    mode_names = {
-        "direct": "直接日志",
-        "k8s": "Kubernetes 容器日志",
-        "docker": "Docker 容器日志",
-    }
+    import questionary
+    from questionary import Choice
 
     # 构建选项列表
     choices = []
     for cfg in log_configs:
-        # 显示日志名称和描述
+        # 显示日志名称和描述（按类型查表取显示属性）
         display_text = cfg.name
 
-        # 使用 getattr 安全访问可选属性
-        if cfg.log_type == "direct":
-            path = getattr(cfg, "path", None)
-            if path:
-                display_text += f" ({path})"
-        elif cfg.log_type == "docker":
-            container_name = getattr(cfg, "container_name", None)
-            if container_name:
-                display_text += f" (容器: {container_name})"
-        elif cfg.log_type == "k8s":
-            pod = getattr(cfg, "pod", None)
-            if pod:
-                display_text += f" (Pod: {pod})"
+        entry = _DISPLAY_ATTR.get(cfg.log_type)
+        if entry:
+            attr, fmt = entry
+            value = getattr(cfg, attr, None)
+            if value:
+                display_text += f" ({fmt.format(value)})"
 
         choices.append(
             Choice(
@@ -118,7 +130,7 @@ def select_log_dialog(log_configs: list["LogConfig"], mode: str) -> "LogConfig |
         )
 
     result = questionary.select(
-        message=f"选择 {mode_names.get(mode, mode)}:",
+        message=f"选择 {_MODE_NAMES.get(mode, mode)}:",
         choices=choices,
     ).ask()
 
@@ -142,6 +154,9 @@ def select_container_dialog(containers: list[str], container_type: str = "容器
     if len(containers) == 1:
         return containers[0]
 
+    import questionary
+    from questionary import Choice
+
     # 构建选项列表
     choices = [Choice(title=c, value=c) for c in containers]
 
@@ -153,6 +168,16 @@ def select_container_dialog(containers: list[str], container_type: str = "容器
     return cast(str | None, result)
 
 
+@lru_cache(maxsize=128)
+def _compile_glob(pattern: str) -> re.Pattern[str]:
+    """把通配符模式编译为正则（按模式字符串缓存）。
+
+    同一容器 glob 在连续 tail 调用间反复使用，
+    缓存后热路径只付匹配成本，不再重建 NFA。
+    """
+    return re.compile(f"^{pattern.replace('*', '.*')}$")
+
+
 def match_containers(pattern: str, containers: list[str]) -> list[str]:
     """模糊匹配容器名（保留此函数，用于 tail.py）。
 
@@ -163,11 +188,10 @@ def match_containers(pattern: str, containers: list[str]) -> list[str]:
     Returns:
         匹配的容器名称列表
     """
-    # 如果模式包含 *，转换为正则表达式
+    # 如果模式包含 *，转换为正则表达式（编译结果缓存）
     if "*" in pattern:
-        regex_pattern = pattern.replace("*", ".*")
-        regex = re.compile(f"^{regex_pattern}$")
-        return [c for c in containers if regex.match(c)]
+        match = _compile_glob(pattern).match
+        return [c for c in containers if match(c)]
 
     # 否则使用部分匹配
     pattern_lower = pattern.lower()
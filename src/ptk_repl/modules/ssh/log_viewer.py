@@ -1,6 +1,7 @@
 """SSH 日志查看器。"""
 
-from typing import TYPE_CHECKING
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
 from ptk_repl.modules.ssh.config import load_ssh_config
 from ptk_repl.modules.ssh.dialogs import select_environment_dialog, select_log_dialog
@@ -11,6 +12,17 @@ from ptk_repl.modules.ssh.tail import tail_log
 if TYPE_CHECKING:
     from ptk_repl.cli import PromptToolkitCLI
 
+# 连接建立的兜底超时（秒）
+_CONNECT_TIMEOUT = 15
+
+
+def _close_unclaimed(future: "Future[Any]") -> None:
+    """关闭无人认领的后台连接（用户中途取消对话框时）。"""
+    try:
+        future.result().close()
+    except Exception:
+        pass
+
 
 class SSHLogViewer:
     """SSH 日志查看器。
@@ -27,6 +39,13 @@ class SSHLogViewer:
         """
         self.cli = cli
         self.ssh_state = ssh_state
+        self._pool: ThreadPoolExecutor | None = None
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """获取后台连接线程池（首次使用时创建）。"""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ssh-connect")
+        return self._pool
 
     def view_log(
         self, env: str | None = None, mode: str | None = None, file: str | None = None
@@ -56,56 +75,64 @@ class SSHLogViewer:
             if not env_name:
                 return
 
-        # 2. 查找环境配置
-        env_config = None
-        for e in config.environments:
-            if e.name == env_name:
-                env_config = e
-                break
+        # 2. 查找环境配置（O(1) 索引查找）
+        env_config = config.env_by_name.get(env_name)
 
         if not env_config:
             self.cli.perror(f"环境 '{env_name}' 不存在")
             return
 
-        # 3. 确定日志模式（优先使用命令行参数，否则使用环境的 log_type）
+        # 3. 环境未连接时，立即在后台线程发起 SSH 握手：
+        # 握手（200ms-2s）与后面的日志模式/文件选择并行进行，
+        # 用户选完日志时连接多半已经就绪
+        conn_info = self.ssh_state.get_connection(env_name)
+        connect_future: Future[Any] | None = None
+        if not conn_info or not conn_info.get_client():
+            self.cli.poutput(f"正在连接到 {env_name}...")
+            ssh_mgr = SSHClientManager()
+            connect_future = self._get_pool().submit(
+                ssh_mgr.connect,
+                host=env_config.host,
+                port=env_config.port,
+                username=env_config.username,
+                password=env_config.password,
+                key_path=env_config.key_path,
+            )
+
+        # 4. 确定日志模式（优先使用命令行参数，否则使用环境的 log_type）
         log_mode = mode or env_config.log_type
 
-        # 4. 从全局配置获取该模式的日志路径
+        # 5. 从全局配置获取该模式的日志路径
         log_configs = config.log_paths.get(log_mode, [])
         if not log_configs:
             self.cli.perror(f"模式 '{log_mode}' 没有配置日志路径")
+            if connect_future:
+                connect_future.add_done_callback(_close_unclaimed)
             return
 
-        # 5. 确定具体的日志文件
+        # 6. 确定具体的日志文件
+        log_config = None
         if file:
-            # 用户指定了文件
-            log_config = next((lc for lc in log_configs if lc.name == file), None)
+            # 用户指定了文件（先建名称索引，一次遍历顺带服务错误提示）
+            log_by_name = {lc.name: lc for lc in log_configs}
+            log_config = log_by_name.get(file)
             if not log_config:
-                available = [lc.name for lc in log_configs]
-                self.cli.perror(f"日志 '{file}' 不存在。可用: {', '.join(available)}")
-                return
+                self.cli.perror(f"日志 '{file}' 不存在。可用: {', '.join(log_by_name)}")
         elif len(log_configs) == 1:
             log_config = log_configs[0]
         else:
-            # 多个日志，弹出选择对话框
+            # 多个日志，弹出选择对话框（此时握手仍在后台进行）
             log_config = select_log_dialog(log_configs, log_mode)
-            if not log_config:
-                return
 
-        # 6. 获取或建立 SSH 连接
-        conn_info = self.ssh_state.get_connection(env_name)
-        if not conn_info or not conn_info.get_client():
-            # 环境未连接，自动建立连接
-            self.cli.poutput(f"正在连接到 {env_name}...")
+        if not log_config:
+            if connect_future:
+                connect_future.add_done_callback(_close_unclaimed)
+            return
+
+        # 7. 等待后台连接完成并入池
+        if connect_future:
             try:
-                ssh_mgr = SSHClientManager()
-                client = ssh_mgr.connect(
-                    host=env_config.host,
-                    port=env_config.port,
-                    username=env_config.username,
-                    password=env_config.password,
-                    key_path=env_config.key_path,
-                )
+                client = connect_future.result(timeout=_CONNECT_TIMEOUT)
 
                 # 创建连接信息
                 conn_info = SSHConnectionInfo(
@@ -127,10 +154,15 @@ class SSHLogViewer:
 
                 self.cli.poutput(f"已连接到 {env_name}")
             except Exception as e:
+                # 超时等场景下握手可能仍在后台进行：挂回调关闭，避免连接泄漏
+                connect_future.add_done_callback(_close_unclaimed)
                 self.cli.perror(f"连接失败: {e}")
                 return
 
-        # 7. 执行日志查看
+        # 控制流保证：未走后台连接分支时 conn_info 必然已带活跃客户端
+        assert conn_info is not None
+
+        # 8. 执行日志查看
         try:
             self.cli.poutput(f"正在查看 {env_name} 的 {log_config.name}... (Ctrl+C 退出)")
             tail_log(conn_info.get_client(), log_config, log_mode)
@@ -42,11 +42,6 @@ class SSHModule(CommandModule):
         """模块描述。"""
         return "SSH 连接管理和日志查看"
 
-    @property
-    def aliases(self) -> str | None:
-        """模块短别名。"""
-        return None
-
     def initialize(self, state_manager: "StateManager") -> None:
         """模块初始化。
 
@@ -89,8 +84,8 @@ class SSHModule(CommandModule):
 
             config = load_ssh_config(cli.config)
 
-            # 解析参数
-            env_name = args.strip() if args.strip() else None
+            # 解析参数（strip 只算一次）
+            env_name = args.strip() or None
 
             if not env_name:
                 # 无参数：弹出交互式对话框
@@ -1,6 +1,54 @@
 """SSH 客户端封装。"""
 
-import paramiko
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import threading
+
+    import paramiko
+
+# 已解析私钥缓存：(路径, mtime) -> PKey。
+# 私钥解析（尤其是加密私钥的 bcrypt KDF）可达百毫秒级，
+# 来回切换环境重连时不应每次都重新读盘解析
+_KEY_CACHE: dict[tuple[str, float], "paramiko.PKey"] = {}
+
+
+def _load_key(key_path: str) -> "paramiko.PKey":
+    """加载私钥文件（按路径 + mtime 缓存解析结果）。
+
+    paramiko 不提供类型自动探测，按 Ed25519/ECDSA/RSA 的顺序
+    逐个尝试，成功的结果入缓存，后续连接不再重复试探。
+
+    Args:
+        key_path: 私钥文件路径
+
+    Returns:
+        解析后的私钥对象
+
+    Raises:
+        paramiko.SSHException: 所有密钥类型均解析失败时抛出
+    """
+    import os
+
+    import paramiko
+
+    cache_key = (key_path, os.stat(key_path).st_mtime)
+    try:
+        return _KEY_CACHE[cache_key]
+    except KeyError:
+        pass
+
+    last_error: Exception | None = None
+    for key_cls in (paramiko.Ed25519Key, paramiko.ECDSAKey, paramiko.RSAKey):
+        try:
+            key = key_cls.from_private_key_file(key_path)
+        except paramiko.SSHException as e:
+            last_error = e
+            continue
+        _KEY_CACHE[cache_key] = key
+        return key
+
+    raise paramiko.SSHException(f"无法解析私钥文件: {key_path}") from last_error
 
 
 class SSHClientManager:
@@ -14,7 +62,7 @@ class SSHClientManager:
         password: str | None = None,
         key_path: str | None = None,
         timeout: int = 10,
-    ) -> paramiko.SSHClient:
+    ) -> "paramiko.SSHClient":
         """建立 SSH 连接。
 
         Args:
@@ -31,44 +79,154 @@ class SSHClientManager:
         Raises:
             Exception: 连接失败时抛出异常
         """
+        # 延迟导入：paramiko 连带 cryptography/bcrypt，很重，
+        # 不用 ssh 功能时不应出现在启动路径上
+        import paramiko
+
         client = paramiko.SSHClient()
         client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
 
+        # 跳过 agent/默认密钥探测（凭据均显式传入），冷连接省 100-500ms
+        connect_kwargs: dict[str, Any] = {
+            "hostname": host,
+            "port": port,
+            "username": username,
+            "timeout": timeout,
+            "banner_timeout": 5,
+            "auth_timeout": 10,
+            "allow_agent": False,
+            "look_for_keys": False,
+        }
+
         try:
             if key_path:
-                # 使用私钥连接
-                key = paramiko.RSAKey.from_private_key_file(key_path)
-                client.connect(
-                    hostname=host, port=port, username=username, pkey=key, timeout=timeout
-                )
+                # 使用私钥连接（解析结果按 mtime 缓存）
+                client.connect(pkey=_load_key(key_path), **connect_kwargs)
             elif password:
                 # 使用密码连接
-                client.connect(
-                    hostname=host, port=port, username=username, password=password, timeout=timeout
-                )
+                client.connect(password=password, **connect_kwargs)
             else:
                 raise ValueError("必须提供 password 或 key_path")
 
+            self._tune_transport(client)
             return client
 
         except Exception as e:
             client.close()
             raise Exception(f"SSH 连接失败 ({host}:{port}): {e}") from e
 
-    def execute_command(self, client: paramiko.SSHClient, command: str) -> tuple[str, str, int]:
-        """执行 SSH 命令。
+    @staticmethod
+    def _tune_transport(client: "paramiko.SSHClient") -> None:
+        """连接建立后的传输层调优。
+
+        - keepalive：防止空闲连接被 NAT 静默掐断，
+          避免下次 tail 时整套 TCP+SSH 握手重来
+        - TCP_NODELAY：交互式小包写入不再被 Nagle 攒批（~40ms/次）
+        """
+        import socket
+
+        transport = client.get_transport()
+        if transport is None:
+            return
+        transport.set_keepalive(30)
+        sock = transport.sock
+        if isinstance(sock, socket.socket):
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except OSError:
+                pass
+        # 代理/隧道等非普通 socket（如 Channel）：跳过
+
+    @staticmethod
+    def _set_environment(channel: "paramiko.Channel", env: dict[str, str]) -> None:
+        """在通道上设置远端环境变量（优先单次批量请求）。
+
+        逐变量 set_environment_variable 每个都是一次 SSH 请求往返；
+        先尝试把所有变量打包为一条自定义全局请求（N*RTT -> 1*RTT），
+        服务器不认识该扩展时再退回逐个设置。
+        """
+        import paramiko
+
+        transport = channel.transport
+        if transport is not None:
+            try:
+                msg = paramiko.Message()
+                msg.add_int(len(env))
+                for name, value in env.items():
+                    msg.add_string(name)
+                    msg.add_string(value)
+                if transport.global_request("envs@ptk_repl", msg.asbytes(), wait=True):
+                    return
+            except Exception:
+                pass
+
+        # 服务器不支持批量扩展：退回逐变量设置
+        for name, value in env.items():
+            channel.set_environment_variable(name, value)
+
+    def execute_command(
+        self,
+        client: "paramiko.SSHClient",
+        command: str,
+        cancel_event: "threading.Event | None" = None,
+        env: dict[str, str] | None = None,
+    ) -> tuple[str, str, int]:
+        """执行 SSH 命令（边到达边读取，stdout/stderr 交错排空）。
+
+        之前的实现在 recv_exit_status 之后两次阻塞 read()，
+        大输出时 stderr 缓冲写满会与远端互相等死，且一次性
+        分配完整字节缓冲。改为 select 驱动的增量读取；
+        轮询间隔 0.1s，线程不会卡死在远端进程上。
 
         Args:
             client: SSH 客户端
             command: 要执行的命令
+            cancel_event: 取消信号（可选）；置位后关闭通道并
+                返回已收到的部分输出，退出码为 -1
+            env: 要设置的远端环境变量（可选，批量下发）
 
         Returns:
             (stdout, stderr, exit_code) 元组
         """
-        stdin, stdout, stderr = client.exec_command(command)
-        exit_code = stdout.channel.recv_exit_status()
+        import select
+
+        transport = client.get_transport()
+        assert transport is not None
+        channel = transport.open_session()
+        if env:
+            self._set_environment(channel, env)
+        channel.exec_command(command)
+
+        out_buf = bytearray()
+        err_buf = bytearray()
+
+        def _drain() -> None:
+            while channel.recv_ready():
+                out_buf.extend(channel.recv(65536))
+            while channel.recv_stderr_ready():
+                err_buf.extend(channel.recv_stderr(65536))
+
+        while not channel.exit_status_ready():
+            if cancel_event is not None and cancel_event.is_set():
+                channel.close()
+                return (
+                    out_buf.decode("utf-8", errors="replace"),
+                    err_buf.decode("utf-8", errors="replace"),
+                    -1,
+                )
+            readable, _, _ = select.select([channel], [], [], 0.1)
+            if readable:
+                _drain()
+
+        # 进程已退出：排空通道里剩余的数据
+        while channel.recv_ready() or channel.recv_stderr_ready():
+            _drain()
 
-        stdout_str = stdout.read().decode("utf-8")
-        stderr_str = stderr.read().decode("utf-8")
+        exit_code = channel.recv_exit_status()
+        channel.close()
 
-        return stdout_str, stderr_str, exit_code
+        return (
+            out_buf.decode("utf-8", errors="replace"),
+            err_buf.decode("utf-8", errors="replace"),
+            exit_code,
+        )
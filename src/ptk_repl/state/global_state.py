@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from ptk_repl.state.connection_context import ConnectionContext
 
@@ -13,6 +13,7 @@ class GlobalState(BaseModel):
     所有模块共享的全局状态。
 
     重构后移除了特定模块的字段，使用组合的连接上下文。
+    每次字段赋值都会递增版本号，供提示符等读取方做缓存失效判断。
     """
 
     model_config = {"arbitrary_types_allowed": True}
@@ -25,6 +26,20 @@ class GlobalState(BaseModel):
     # 使用组合而非专用字段
     connection_context: ConnectionContext | None = Field(default=None, exclude=True)
 
+    # 单调版本号（任意字段赋值时 +1）
+    _version: int = PrivateAttr(default=0)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """字段赋值时递增版本号（私有属性赋值不计）。"""
+        super().__setattr__(name, value)
+        if name[0] != "_":
+            self._version += 1
+
+    @property
+    def version(self) -> int:
+        """状态版本号（单调递增）。"""
+        return self._version
+
     def set_connection_context(self, context: ConnectionContext) -> None:
         """设置连接上下文。
 
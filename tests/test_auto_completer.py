@@ -89,6 +89,30 @@ class TestAutoCompleter:
         assert completer._completion_dict is not None
         assert dict1 == dict2  # 内容相同，但缓存被重新生成
 
+    def test_batch_invalidate(self, completer: AutoCompleter) -> None:
+        """测试批量失效上下文合并多次刷新。"""
+        # 第一次构建
+        completer.build_completion_dict()
+        assert completer._completion_dict is not None
+
+        with completer.batch_invalidate():
+            # 批量期间的刷新只记脏标记，不清缓存
+            completer.refresh()
+            completer.refresh()
+            assert completer._completion_dict is not None
+
+        # 退出时统一失效一次
+        assert completer._completion_dict is None
+
+    def test_batch_invalidate_clean_exit(self, completer: AutoCompleter) -> None:
+        """测试批量期间无刷新时缓存保持有效。"""
+        completer.build_completion_dict()
+
+        with completer.batch_invalidate():
+            pass
+
+        assert completer._completion_dict is not None
+
     def test_register_lazy_commands(self, completer: AutoCompleter) -> None:
         """测试注册懒加载命令。"""
         # 注册懒加载命令
@@ -149,9 +173,9 @@ class TestAutoCompleter:
         # 验证懒加载模块在顶层
         assert "database" in completion_dict[""]
 
-        # 验证懒加载模块的子命令
+        # 验证懒加载模块的子命令（存储为不可变元组）
         assert "database" in completion_dict
-        assert completion_dict["database"] == ["connect", "query"]
+        assert completion_dict["database"] == ("connect", "query")
 
     def test_get_short_alias(self, completer: AutoCompleter) -> None:
         """测试获取短别名。"""
@@ -295,9 +295,13 @@ class TestCommandRegistry:
         assert "mock test1" in all_commands
         assert "mock test2" in all_commands
 
-        # 验证返回的是副本（修改不影响原始）
-        all_commands["new command"] = ("mock", "new", handler)
-        assert registry.get_command_info("new command") is None
+        # 验证返回的是只读视图（不可修改）
+        with pytest.raises(TypeError):
+            all_commands["new command"] = ("mock", "new", handler)  # type: ignore[index]
+
+        # 视图随注册实时更新
+        registry.register_command("mock", "test3", handler)
+        assert "mock test3" in all_commands
 
     def test_get_all_aliases(self, registry: CommandRegistry) -> None:
         """测试获取所有别名。"""
@@ -313,10 +317,30 @@ class TestCommandRegistry:
         assert "mt" in all_aliases
         assert all_aliases["t"] == "mock test"
 
-        # 验证返回的是副本（修改不影响原始）
-        all_aliases["new_alias"] = "mock test"
+        # 验证返回的是只读视图（不可修改）
+        with pytest.raises(TypeError):
+            all_aliases["new_alias"] = "mock test"  # type: ignore[index]
         assert "new_alias" not in registry.get_all_aliases()
 
+    def test_get_aliases_for(self, registry: CommandRegistry) -> None:
+        """测试获取命令的所有别名（倒排索引）。"""
+        def handler():
+            pass
+
+        # 注册带别名的命令
+        registry.register_command("mock", "test", handler, aliases=["t", "mt"])
+
+        # 别名应通过倒排索引往返取回
+        assert registry.get_aliases_for("mock test") == ["t", "mt"]
+
+        # 未知命令返回空列表
+        assert registry.get_aliases_for("unknown") == []
+
+        # 返回的是副本，修改不影响注册表
+        aliases = registry.get_aliases_for("mock test")
+        aliases.append("hacked")
+        assert registry.get_aliases_for("mock test") == ["t", "mt"]
+
     def test_resolve_module_name(
         self, registry: CommandRegistry, mock_module: MockModule
     ) -> None:
@@ -74,6 +74,10 @@ class MockModuleLoader:
         if not self.is_loaded(module_name):
             self.load(module_name)
 
+    def find_by_alias(self, alias: str) -> str | None:
+        """通过别名查找懒加载模块名。"""
+        return None
+
     @property
     def loaded_modules(self) -> dict[str, CommandModule]:
         return self._loaded.copy()
@@ -160,12 +164,16 @@ class MockRegistry:
         return self._modules.get(module_name)
 
     def get_all_commands(self) -> dict:
-        """获取所有命令。"""
-        return self._commands.copy()
+        """获取所有命令（只读视图）。"""
+        return self._commands
 
     def get_all_aliases(self) -> dict[str, str]:
-        """获取所有别名。"""
-        return self._aliases.copy()
+        """获取所有别名（只读视图）。"""
+        return self._aliases
+
+    def get_aliases_for(self, command: str) -> list[str]:
+        """获取命令的所有别名。"""
+        return [alias for alias, cmd in self._aliases.items() if cmd == command]
 
     def list_modules(self) -> list:
         """列出所有模块。"""